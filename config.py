@@ -50,10 +50,24 @@ class ScraperConfig(BaseModel):
     max_tokens: int = Field(default=500, description="Maximum tokens to scrape")
     max_tokens_for_transactions: int = Field(default=50, description="Max tokens to get transactions for")
     transactions_per_token: int = Field(default=100, description="Transactions per token")
+    max_concurrent_requests: int = Field(default=8, description="Max concurrent per-token API requests")
+    max_collected_tokens: int = Field(default=10000, description="Tokens kept in memory before evicting the least recently seen")
+    max_collected_transactions: int = Field(default=50000, description="Transactions kept in memory before evicting the oldest")
     new_launches_hours: int = Field(default=24, description="Hours to look back for new launches")
 
     # Moralis Polling Configuration
     moralis_poll_interval: int = Field(default=20, description="Polling interval for Moralis API in seconds")
+    moralis_rate_limit_rpm: int = Field(default=600, description="Client-side Moralis request budget per minute")
+    moralis_rate_limit_burst: Optional[int] = Field(
+        default=None,
+        description="Moralis requests allowed back to back (default: a tenth of the per-minute budget)",
+    )
+    moralis_max_token_pages: int = Field(default=5, description="Listing pages to walk per poll before stopping")
+    moralis_cache_policy: str = Field(
+        default="enabled",
+        description="Moralis response cache policy (enabled, read_only, write_only, replay, disabled)",
+    )
+    moralis_cache_path: Optional[str] = Field(default=None, description="SQLite file persisting Moralis responses")
     
     # WebSocket Configuration (Legacy PumpPortal)
     websocket_reconnect_attempts: int = Field(default=5, description="Max WebSocket reconnection attempts")
@@ -90,6 +104,10 @@ class ScraperConfig(BaseModel):
     output_directory: str = Field(default="data", description="Directory to save scraped data")
     output_format: str = Field(default="json", description="Output format: json, csv, or both")
     include_timestamps: bool = Field(default=True, description="Include timestamps in output")
+    sqlite_strict_durability: bool = Field(
+        default=False,
+        description="Use synchronous=FULL for the SQLite store instead of the faster NORMAL",
+    )
 
     # Logging Configuration
     log_level: str = Field(default="INFO", description="Logging level")
@@ -113,13 +131,13 @@ class ScraperConfig(BaseModel):
         if config_file.exists():
             with open(config_file, "r", encoding="utf-8") as file:
                 config_data = yaml.safe_load(file) or {}
-                
-                # Override with environment variable if set
-                env_api_key = os.getenv("MORALIS_API_KEY")
-                if env_api_key:
-                    config_data["moralis_api_key"] = env_api_key
-                
-                return cls(**config_data)
+            
+            # Override with environment variable if set
+            env_api_key = os.getenv("MORALIS_API_KEY")
+            if env_api_key:
+                config_data["moralis_api_key"] = env_api_key
+            
+            return cls(**config_data)
 
         default_config = cls()
         default_config.save(config_path)
@@ -137,6 +155,15 @@ class ScraperConfig(BaseModel):
         if self.rate_limit_rpm <= 0 or self.rate_limit_rph <= 0:
             raise ValueError("Rate limits must be positive")
 
+        if self.moralis_rate_limit_rpm < 0:
+            raise ValueError("Moralis rate limit cannot be negative")
+
+        if self.moralis_rate_limit_burst is not None and self.moralis_rate_limit_burst <= 0:
+            raise ValueError("Moralis rate limit burst must be positive")
+
+        if self.moralis_cache_policy not in ("enabled", "read_only", "write_only", "replay", "disabled"):
+            raise ValueError(f"Unknown Moralis cache policy: {self.moralis_cache_policy}")
+
         if self.max_tokens <= 0:
             raise ValueError("Max tokens must be positive")
 
@@ -146,6 +173,15 @@ class ScraperConfig(BaseModel):
         if self.api_page_size <= 0:
             raise ValueError("API page size must be positive")
 
+        if self.moralis_max_token_pages <= 0:
+            raise ValueError("Moralis max token pages must be positive")
+
+        if self.max_concurrent_requests <= 0:
+            raise ValueError("Max concurrent requests must be positive")
+
+        if self.max_collected_tokens <= 0 or self.max_collected_transactions <= 0:
+            raise ValueError("Collection caps must be positive")
+
         if self.request_delay < 0:
             raise ValueError("Request delay cannot be negative")
 
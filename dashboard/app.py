@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
+import threading
 import time
-from typing import Any, Dict, Generator
+from typing import Dict, Generator
 
-from flask import Flask, Response, jsonify, render_template
+import orjson
+from flask import Flask, Response, render_template
 
 from .data_service import PumpFunDataService
 
@@ -17,6 +18,10 @@ LIVE_UPDATE_INTERVAL = max(
     int(os.getenv("PUMP_FUN_LIVE_INTERVAL", str(DEFAULT_REFRESH_INTERVAL))),
 )
 
+CONNECTED_EVENT = b"data: " + orjson.dumps(
+    {"type": "connected", "message": "Live updates active"}
+) + b"\n\n"
+
 logger = logging.getLogger(__name__)
 
 def create_app(data_source: str | None = None) -> Flask:
@@ -27,6 +32,75 @@ def create_app(data_source: str | None = None) -> Flask:
     # Track known coins to detect new ones
     known_coin_ids = set()
 
+    # Every stream client gets the same update, so it is built and encoded once
+    # per tick and shared as bytes
+    snapshot_lock = threading.Lock()
+    snapshot: tuple[float, bytes] | None = None
+
+    def build_update_event() -> bytes:
+        nonlocal known_coin_ids
+
+        dataset = data_service.load()
+        tokens = dataset.get("tokens", [])
+        dataset_source = dataset.get("source_path")
+        using_sample = dataset.get("using_sample_data")
+        logger.info(
+            "Stream update loaded %d tokens (source=%s, sample=%s)",
+            len(tokens),
+            dataset_source,
+            using_sample,
+        )
+
+        # Detect new coins
+        new_coins = []
+        current_coin_ids = set()
+        
+        for token in tokens:
+            coin_id = token.get("mint_address") or token.get("symbol") or token.get("name")
+            if coin_id:
+                current_coin_ids.add(coin_id)
+                if coin_id not in known_coin_ids:
+                    new_coins.append(token)
+
+        if new_coins:
+            coin_labels = [
+                token.get("symbol")
+                or token.get("name")
+                or token.get("mint_address")
+                for token in new_coins[:5]
+            ]
+            display_labels = ", ".join(filter(None, coin_labels))
+            if len(new_coins) > 5:
+                display_labels = f"{display_labels}, ..." if display_labels else "..."
+            logger.info(
+                "Stream detected %d new coins: %s",
+                len(new_coins),
+                display_labels or "unidentified coins",
+            )
+        
+        # Update known coins
+        known_coin_ids = current_coin_ids
+        
+        # Prepare update data
+        update_data = {
+            "type": "update",
+            "timestamp": time.time(),
+            "tokens": tokens,
+            "new_coins": new_coins,
+            "dataset_timestamp": dataset.get("dataset_timestamp"),
+            "using_sample_data": dataset.get("using_sample_data", False),
+        }
+        return b"data: " + orjson.dumps(update_data, default=str) + b"\n\n"
+
+    def current_update_event() -> bytes:
+        nonlocal snapshot
+
+        with snapshot_lock:
+            now = time.monotonic()
+            if snapshot is None or now - snapshot[0] >= LIVE_UPDATE_INTERVAL:
+                snapshot = (now, build_update_event())
+            return snapshot[1]
+
     @app.route("/")
     def index() -> str:
         return render_template(
@@ -36,7 +110,7 @@ def create_app(data_source: str | None = None) -> Flask:
         )
 
     @app.route("/api/data")
-    def get_data() -> Dict[str, Any]:
+    def get_data() -> Response:
         dataset = data_service.load()
         tokens = dataset.get("tokens", [])
         logger.info(
@@ -45,72 +119,21 @@ def create_app(data_source: str | None = None) -> Flask:
             dataset.get("source_path"),
             dataset.get("using_sample_data"),
         )
-        return jsonify(dataset)
+        # The dataset can hold thousands of rows; orjson encodes it far faster
+        # than Flask's stdlib-backed jsonify
+        return Response(orjson.dumps(dataset, default=str), mimetype="application/json")
 
     @app.route("/api/stream")
     def stream() -> Response:
         """Server-Sent Events endpoint for real-time updates"""
         
-        def generate() -> Generator[str, None, None]:
-            nonlocal known_coin_ids
-            
+        def generate() -> Generator[bytes, None, None]:
             # Send initial connection message
-            yield f"data: {json.dumps({'type': 'connected', 'message': 'Live updates active'})}\n\n"
+            yield CONNECTED_EVENT
             
             while True:
                 try:
-                    dataset = data_service.load()
-                    tokens = dataset.get("tokens", [])
-                    dataset_source = dataset.get("source_path")
-                    using_sample = dataset.get("using_sample_data")
-                    logger.info(
-                        "Stream update loaded %d tokens (source=%s, sample=%s)",
-                        len(tokens),
-                        dataset_source,
-                        using_sample,
-                    )
-
-                    # Detect new coins
-                    new_coins = []
-                    current_coin_ids = set()
-                    
-                    for token in tokens:
-                        coin_id = token.get("mint_address") or token.get("symbol") or token.get("name")
-                        if coin_id:
-                            current_coin_ids.add(coin_id)
-                            if coin_id not in known_coin_ids:
-                                new_coins.append(token)
-
-                    if new_coins:
-                        coin_labels = [
-                            token.get("symbol")
-                            or token.get("name")
-                            or token.get("mint_address")
-                            for token in new_coins[:5]
-                        ]
-                        display_labels = ", ".join(filter(None, coin_labels))
-                        if len(new_coins) > 5:
-                            display_labels = f"{display_labels}, ..." if display_labels else "..."
-                        logger.info(
-                            "Stream detected %d new coins: %s",
-                            len(new_coins),
-                            display_labels or "unidentified coins",
-                        )
-                    
-                    # Update known coins
-                    known_coin_ids = current_coin_ids
-                    
-                    # Prepare update data
-                    update_data = {
-                        "type": "update",
-                        "timestamp": time.time(),
-                        "tokens": tokens,
-                        "new_coins": new_coins,
-                        "dataset_timestamp": dataset.get("dataset_timestamp"),
-                        "using_sample_data": dataset.get("using_sample_data", False),
-                    }
-                    
-                    yield f"data: {json.dumps(update_data)}\n\n"
+                    yield current_update_event()
                     
                     time.sleep(LIVE_UPDATE_INTERVAL)
                     
@@ -121,7 +144,7 @@ def create_app(data_source: str | None = None) -> Flask:
                         "message": str(e),
                         "timestamp": time.time(),
                     }
-                    yield f"data: {json.dumps(error_data)}\n\n"
+                    yield b"data: " + orjson.dumps(error_data) + b"\n\n"
                     time.sleep(LIVE_UPDATE_INTERVAL)
         
         return Response(generate(), mimetype="text/event-stream")
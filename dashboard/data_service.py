@@ -337,10 +337,13 @@ class PumpFunDataService:
     def _load_session_metadata(
         self, directory: Path
     ) -> Tuple[Dict[str, Any], Optional[datetime]]:
-        session_files = sorted(directory.glob("session_stats*.json"))
-        if not session_files:
+        latest = max(
+            directory.glob("session_stats*.json"),
+            key=lambda path: path.stat().st_mtime,
+            default=None,
+        )
+        if latest is None:
             return {}, None
-        latest = max(session_files, key=lambda path: path.stat().st_mtime)
         data = self._read_json(latest)
         timestamp = self._guess_timestamp_from_filename(latest.name)
 
@@ -375,9 +378,12 @@ class PumpFunDataService:
         if stats_file.exists():
             return self._read_json(stats_file)
         # otherwise look for aggregated stats in metadata load
-        session_files = sorted(directory.glob("session_stats*.json"))
-        if session_files:
-            latest = max(session_files, key=lambda path: path.stat().st_mtime)
+        latest = max(
+            directory.glob("session_stats*.json"),
+            key=lambda path: path.stat().st_mtime,
+            default=None,
+        )
+        if latest is not None:
             return self._read_json(latest)
         return {}
 
@@ -6,11 +6,11 @@ This example demonstrates how to use the official PumpPortal.fun API
 to collect real-time token data, transactions, and new launches.
 """
 
-import asyncio
 import json
 from datetime import datetime
 from config import ScraperConfig
 from main import PumpPortalScraper
+from utils import event_loop
 
 
 async def basic_example():
@@ -176,4 +176,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    event_loop.run(main())
\ No newline at end of file
@@ -13,8 +13,9 @@ import json
 import logging
 import signal
 import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse, parse_qs
 
 import websockets
@@ -23,7 +24,8 @@ from websockets.exceptions import ConnectionClosed, WebSocketException
 
 from config import ScraperConfig
 from models import TokenInfo, TransactionData
-from utils.data_storage import DataStorage
+from utils import event_loop
+from utils.data_storage import DataStorage, file_stamp
 from utils.logger import setup_logger
 from utils.rate_limiter import AdaptiveRateLimiter
 
@@ -62,7 +64,10 @@ class PumpPortalScraper:
     def __init__(self, config: ScraperConfig):
         self.config = config
         self.logger = setup_logger(__name__, config.log_level)
-        self.data_storage = DataStorage(config.output_directory)
+        self.data_storage = DataStorage(
+            config.output_directory,
+            strict_durability=config.sqlite_strict_durability,
+        )
         self.rate_limiter = AdaptiveRateLimiter(
             requests_per_minute=config.rate_limit_rpm,
             requests_per_hour=config.rate_limit_rph
@@ -70,7 +75,7 @@ class PumpPortalScraper:
         
         # WebSocket connection
         self.websocket: Optional[WebSocketClientProtocol] = None
-        self.connection_url = self._build_websocket_url()
+        self.connection_url = self._build_websocket_url(config)
         
         # Data collection
         self.collected_tokens: Dict[str, TokenInfo] = {}
@@ -96,13 +101,64 @@ class PumpPortalScraper:
         self._shutdown_event = asyncio.Event()
         self._setup_signal_handlers()
     
-    def _build_websocket_url(self) -> str:
+    # Streams requested after connecting
+    SUBSCRIPTIONS = (
+        {"method": "subscribeNewToken"},
+        {"method": "subscribeMigration"},
+        # We can add specific token/account subscriptions later if needed
+    )
+    
+    @staticmethod
+    def _build_websocket_url(config: ScraperConfig) -> str:
         """Build WebSocket URL with optional API key"""
-        url = self.config.websocket_url
-        if self.config.api_key:
-            url = f"{url}?api-key={self.config.api_key}"
+        url = config.websocket_url
+        if config.api_key:
+            url = f"{url}?api-key={config.api_key}"
         return url
     
+    @staticmethod
+    async def _open_websocket(config: ScraperConfig, url: str) -> WebSocketClientProtocol:
+        """Open a WebSocket connection with the configured timeouts"""
+        return await asyncio.wait_for(
+            websockets.connect(
+                url,
+                ping_interval=config.websocket_ping_interval,
+                ping_timeout=config.websocket_timeout / 2,
+                close_timeout=10
+            ),
+            timeout=config.websocket_timeout
+        )
+    
+    @classmethod
+    @asynccontextmanager
+    async def probe(cls, config: ScraperConfig) -> AsyncIterator[Optional[WebSocketClientProtocol]]:
+        """
+        Connect and subscribe for a short connectivity check
+        
+        Unlike entering the scraper itself, this sets up no data storage,
+        rate limiter or signal handlers.
+        
+        Args:
+            config: Scraper configuration
+            
+        Yields:
+            The subscribed WebSocket, or None if the connection failed
+        """
+        logger = setup_logger(__name__, config.log_level)
+        try:
+            websocket = await cls._open_websocket(config, cls._build_websocket_url(config))
+        except Exception as e:
+            logger.error(f"Failed to connect to WebSocket: {e}")
+            yield None
+            return
+        
+        try:
+            for subscription in cls.SUBSCRIPTIONS:
+                await websocket.send(json.dumps(subscription))
+            yield websocket
+        finally:
+            await websocket.close()
+    
     def _setup_signal_handlers(self):
         """Setup signal handlers for graceful shutdown"""
         def signal_handler(signum, frame):
@@ -137,6 +193,7 @@ class PumpPortalScraper:
         if self.websocket:
             await self.websocket.close()
             self.websocket = None
+        await self.data_storage.close()
         self.logger.info("Scraper cleanup completed")
     
     async def connect_websocket(self) -> bool:
@@ -145,15 +202,7 @@ class PumpPortalScraper:
             self.logger.info(f"Connecting to WebSocket: {self.connection_url}")
             
             # Connection with timeout
-            self.websocket = await asyncio.wait_for(
-                websockets.connect(
-                    self.connection_url,
-                    ping_interval=self.config.websocket_ping_interval,
-                    ping_timeout=self.config.websocket_timeout / 2,
-                    close_timeout=10
-                ),
-                timeout=self.config.websocket_timeout
-            )
+            self.websocket = await self._open_websocket(self.config, self.connection_url)
             
             self.is_connected = True
             self.reconnection_attempts = 0
@@ -176,13 +225,7 @@ class PumpPortalScraper:
         if not self.websocket:
             raise RuntimeError("WebSocket not connected")
         
-        subscriptions = [
-            {"method": "subscribeNewToken"},
-            {"method": "subscribeMigration"},
-            # We can add specific token/account subscriptions later if needed
-        ]
-        
-        for subscription in subscriptions:
+        for subscription in self.SUBSCRIPTIONS:
             try:
                 await self.websocket.send(json.dumps(subscription))
                 self.logger.info(f"Subscribed to: {subscription['method']}")
@@ -972,29 +1015,33 @@ class PumpPortalScraper:
     async def _save_current_data(self):
         """Save current data to disk using consistent filenames for real-time updates"""
         try:
-            # Use consistent filenames so dashboard always reads latest data
+            # Use consistent filenames so dashboard always reads latest data.
+            # The collections are independent, so write them concurrently
             tokens_list = list(self.collected_tokens.values())
+            stamp = file_stamp()
+            saves = []
             
-            if tokens_list:
-                await self.data_storage.save_tokens(
+            if tokens_list or self.collected_transactions:
+                # Tokens and transactions share one database commit
+                saves.append(self.data_storage.save_batch(
                     tokens_list,
-                    format_type=self.config.output_format,
-                )
-                self.logger.debug(f"Saved {len(tokens_list)} tokens to disk")
-            
-            if self.collected_transactions:
-                await self.data_storage.save_transactions(
                     self.collected_transactions,
                     format_type=self.config.output_format,
-                )
-                self.logger.debug(f"Saved {len(self.collected_transactions)} transactions to disk")
+                    timestamp=stamp,
+                ))
             
             if self.new_launches:
-                await self.data_storage.save_new_launches(
+                saves.append(self.data_storage.save_new_launches(
                     self.new_launches,
                     format_type=self.config.output_format,
-                )
-                self.logger.debug(f"Saved {len(self.new_launches)} new launches to disk")
+                    timestamp=stamp,
+                ))
+            
+            await asyncio.gather(*saves)
+            self.logger.debug(
+                f"Saved {len(tokens_list)} tokens, {len(self.collected_transactions)} transactions "
+                f"and {len(self.new_launches)} new launches to disk"
+            )
             
         except Exception as e:
             self.logger.error(f"Error saving current data: {e}")
@@ -1189,4 +1236,4 @@ if __name__ == "__main__":
                 print(f"✓ Total collected: {len(results['tokens'])} tokens, {len(results['transactions'])} transactions, {len(results['new_launches'])} new launches")
                 print("=" * 70)
     
-    asyncio.run(main())
\ No newline at end of file
+    event_loop.run(main())
\ No newline at end of file
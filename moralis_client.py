@@ -5,14 +5,38 @@ https://docs.moralis.com/web3-data-api/solana/pump-fun-tutorials
 """
 
 import asyncio
+import hashlib
 import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
 from httpx import AsyncClient, HTTPStatusError, RequestError
+from pydantic import ValidationError
 
 from models import TokenInfo, TransactionData
+from moralis_parsers import (
+    TokenParser,
+    build_token_parser,
+    parse_token_row,
+    parse_transaction_row,
+)
+
+# httpx decodes Brotli transparently when the brotli package is installed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "br, gzip"
+except ImportError:
+    ACCEPT_ENCODING = "gzip"
+
+
+class CacheMiss(LookupError):
+    """Raised in replay mode when a request has no cached response"""
 
 
 class MoralisClient:
@@ -23,8 +47,38 @@ class MoralisClient:
     
     BASE_URL = "https://solana-gateway.moralis.io"
     NETWORK = "mainnet"  # Solana mainnet
+    MAX_PAGE_SIZE = 100  # Largest page Moralis returns per request
+    ERROR_BODY_LOG_LIMIT = 512  # Bytes of an error response body to log
+    KNOWN_MINTS_SIZE = 10000  # Resolved mints remembered for parallel fetches
+    
+    # Exponential backoff after consecutive 429 responses, in seconds
+    RATE_LIMIT_BACKOFF_BASE = 1.0
+    RATE_LIMIT_BACKOFF_MAX = 60.0
     
-    def __init__(self, api_key: str, timeout: float = 30.0, logger: Optional[logging.Logger] = None):
+    # Response cache TTLs in seconds
+    METADATA_CACHE_TTL = 3600.0
+    PRICE_CACHE_TTL = 300.0
+    LISTING_CACHE_TTL = 300.0
+    CACHE_MAX_ENTRIES = 10000
+    CACHE_LOW_WATER = 9000  # Size the cache is trimmed to once it overflows
+    
+    # enabled: read and write; read_only: never write; write_only: always
+    # fetch and record; replay: serve only from cache (expired entries too),
+    # raising CacheMiss otherwise; disabled: bypass the cache entirely
+    CACHE_POLICIES = ("enabled", "read_only", "write_only", "replay", "disabled")
+    
+    def __init__(
+        self,
+        api_key: str,
+        timeout: float = 30.0,
+        logger: Optional[logging.Logger] = None,
+        listing_ttl: float = LISTING_CACHE_TTL,
+        redis: Optional[Any] = None,
+        requests_per_minute: float = 600,
+        burst_limit: Optional[int] = None,
+        cache_policy: str = "enabled",
+        cache_path: Optional[str] = None,
+    ):
         """
         Initialize Moralis API client
         
@@ -32,9 +86,18 @@ class MoralisClient:
             api_key: Moralis API key
             timeout: Request timeout in seconds
             logger: Optional logger instance
+            listing_ttl: Cache TTL for token listings in seconds (0 disables)
+            redis: Optional redis.asyncio.Redis client used as a shared cache tier
+            requests_per_minute: Client-side request budget (0 disables throttling)
+            burst_limit: Requests allowed back to back before throttling kicks
+                in (defaults to a tenth of requests_per_minute)
+            cache_policy: One of CACHE_POLICIES
+            cache_path: Optional SQLite file persisting cached responses across runs
         """
         if not api_key:
             raise ValueError("Moralis API key is required")
+        if cache_policy not in self.CACHE_POLICIES:
+            raise ValueError(f"Unknown cache policy: {cache_policy}")
         
         self.api_key = api_key
         self.timeout = timeout
@@ -43,12 +106,57 @@ class MoralisClient:
         self.headers = {
             "X-API-Key": api_key,
             "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
             "Content-Type": "application/json",
         }
         
+        # Pooled limits shared by every request; HTTP/2 multiplexes bursts
+        # of concurrent calls over a few long-lived TLS connections
+        self._limits = httpx.Limits(
+            max_connections=1000,
+            max_keepalive_connections=100,
+            keepalive_expiry=60,
+        )
+        
         self.client: Optional[AsyncClient] = None
         self._rate_limit_remaining = None
         self._rate_limit_reset = None
+        
+        # Token bucket refilling at requests_per_minute / 60 tokens per second.
+        # A small capacity keeps a cold start from bursting into 429s
+        self._rps = requests_per_minute / 60.0
+        if burst_limit is None:
+            burst_limit = int(requests_per_minute) // 10
+        self._bucket_capacity = float(max(1, min(burst_limit, requests_per_minute)))
+        self._bucket_tokens = self._bucket_capacity
+        self._last_refill = time.monotonic()
+        self._bucket_lock = asyncio.Lock()
+        
+        # Monotonic time before which the server asked us not to send requests
+        self.next_allowed_at = 0.0
+        self._consecutive_rate_limits = 0
+        
+        # Mints whose metadata has resolved at least once, least recently
+        # used first
+        self._known_mints: "OrderedDict[str, None]" = OrderedDict()
+        
+        # Response cache: key -> (expires_at, data), least recently used
+        # first, with per-key locks so concurrent misses for the same request
+        # share a single API call
+        self.listing_ttl = listing_ttl
+        self._cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._cache_locks: Dict[str, asyncio.Lock] = {}
+        self._cache_lock_users: Dict[str, int] = {}
+        self._redis = redis
+        self.cache_policy = cache_policy
+        self.cache_path = cache_path
+        self._cache_db: Optional[sqlite3.Connection] = None
+        # The persistent cache is only touched from this thread, never the
+        # loop; started on first use and shut down on exit
+        self._cache_db_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Replaced by a schema-specialized parser after the first listing page
+        self._token_parser: TokenParser = parse_token_row
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -56,6 +164,14 @@ class MoralisClient:
             base_url=self.BASE_URL,
             headers=self.headers,
             timeout=self.timeout,
+            # The transport owns the connection pool, so pool limits and
+            # HTTP/2 are set there; AsyncClient ignores them once a
+            # transport is given
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=0,
+                limits=self._limits,
+            ),
             follow_redirects=True,
         )
         return self
@@ -64,6 +180,88 @@ class MoralisClient:
         """Async context manager exit"""
         if self.client:
             await self.client.aclose()
+        if self._cache_db_executor is not None:
+            await self._run_cache_db(self._close_cache_db)
+            self._cache_db_executor.shutdown()
+            self._cache_db_executor = None
+    
+    async def _run_cache_db(self, func, *args):
+        """Run a blocking persistent-cache call on the dedicated SQLite thread"""
+        if self._cache_db_executor is None:
+            self._cache_db_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="moralis-cache"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cache_db_executor, func, *args)
+    
+    def _close_cache_db(self):
+        """Close the persistent cache; it reopens on next use"""
+        if self._cache_db is not None:
+            self._cache_db.close()
+            self._cache_db = None
+    
+    async def _acquire_request_token(self):
+        """Wait until the server window and the token bucket allow another request"""
+        async with self._bucket_lock:
+            delay = self.next_allowed_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            
+            if self._rps <= 0:
+                return
+            
+            now = time.monotonic()
+            self._bucket_tokens = min(
+                self._bucket_capacity,
+                self._bucket_tokens + (now - self._last_refill) * self._rps,
+            )
+            self._last_refill = now
+            
+            if self._bucket_tokens < 1:
+                wait_time = (1 - self._bucket_tokens) / self._rps
+                await asyncio.sleep(wait_time)
+                self._bucket_tokens = 1.0
+                self._last_refill = time.monotonic()
+            
+            self._bucket_tokens -= 1
+    
+    def _reconcile_rate_limit(self, remaining: Optional[str]):
+        """Snap the local bucket down to the server-reported remaining quota"""
+        if remaining is None:
+            return
+        try:
+            remaining_value = float(remaining)
+        except (TypeError, ValueError):
+            return
+        if remaining_value < self._bucket_tokens:
+            self._bucket_tokens = max(0.0, remaining_value)
+    
+    def _update_rate_limit_window(self, status_code: int):
+        """Push next_allowed_at out after a 429 or an exhausted quota"""
+        reset_delay = None
+        if self._rate_limit_reset is not None:
+            try:
+                reset_delay = float(self._rate_limit_reset)
+            except (TypeError, ValueError):
+                pass
+            else:
+                # Accept both epoch timestamps and seconds-until-reset
+                if reset_delay > 1e9:
+                    reset_delay -= time.time()
+                reset_delay = max(0.0, reset_delay)
+        
+        if status_code == 429:
+            self._consecutive_rate_limits += 1
+            backoff = min(
+                self.RATE_LIMIT_BACKOFF_MAX,
+                self.RATE_LIMIT_BACKOFF_BASE * 2 ** (self._consecutive_rate_limits - 1),
+            )
+            self.next_allowed_at = time.monotonic() + max(backoff, reset_delay or 0.0)
+            return
+        
+        self._consecutive_rate_limits = 0
+        if self._rate_limit_remaining == "0" and reset_delay:
+            self.next_allowed_at = time.monotonic() + reset_delay
     
     async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """
@@ -84,33 +282,225 @@ class MoralisClient:
         if not self.client:
             raise RuntimeError("Client not initialized. Use 'async with' context manager.")
         
+        await self._acquire_request_token()
+        
         try:
-            response = await self.client.request(method, endpoint, **kwargs)
-            
-            # Update rate limit info from headers
-            self._rate_limit_remaining = response.headers.get("x-rate-limit-remaining")
-            self._rate_limit_reset = response.headers.get("x-rate-limit-reset")
-            
-            # Log rate limit info
-            if self._rate_limit_remaining:
-                self.logger.debug(f"Rate limit remaining: {self._rate_limit_remaining}")
-            
-            response.raise_for_status()
-            return response.json()
+            async with self.client.stream(method, endpoint, **kwargs) as response:
+                # Update rate limit info from headers
+                self._rate_limit_remaining = response.headers.get("x-rate-limit-remaining")
+                self._rate_limit_reset = response.headers.get("x-rate-limit-reset")
+                self._reconcile_rate_limit(self._rate_limit_remaining)
+                self._update_rate_limit_window(response.status_code)
+                
+                # Log rate limit info
+                if self._rate_limit_remaining:
+                    self.logger.debug("Rate limit remaining: %s", self._rate_limit_remaining)
+                
+                if not response.is_success:
+                    # Load the body so the error handler can log it
+                    await response.aread()
+                    response.raise_for_status()
+                
+                # Accumulate decoded chunks into one buffer and parse it in place
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body += chunk
+                return orjson.loads(body)
             
         except HTTPStatusError as e:
-            self.logger.error(f"HTTP error {e.response.status_code} for {endpoint}: {e.response.text}")
+            self.logger.error(
+                "HTTP error %s for %s: %s",
+                e.response.status_code,
+                endpoint,
+                e.response.content[:self.ERROR_BODY_LOG_LIMIT].decode("utf-8", "replace"),
+            )
             raise
         except RequestError as e:
-            self.logger.error(f"Request error for {endpoint}: {str(e)}")
+            self.logger.error("Request error for %s: %s", endpoint, e)
             raise
     
+    @classmethod
+    def _page_params(cls, limit: int, offset: int) -> Dict[str, int]:
+        """Build limit/offset query params, clamping limit to the page maximum"""
+        return {"limit": min(limit, cls.MAX_PAGE_SIZE), "offset": offset}
+    
+    @staticmethod
+    def _cache_key(method: str, endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+        """Build a stable cache key from the request method, endpoint and params"""
+        raw = f"{method}|{endpoint}|{sorted((params or {}).items())}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+    
+    def _cache_lookup(self, key: str, include_expired: bool = False) -> Tuple[bool, Any]:
+        """Return (hit, data) for a fresh in-process cache entry"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return False, None
+        expires_at, data = entry
+        if expires_at <= time.monotonic() and not include_expired:
+            del self._cache[key]
+            return False, None
+        self._cache.move_to_end(key)
+        return True, data
+    
+    def _cache_store(self, key: str, data: Any, ttl: float):
+        """Store a response, trimming the cache when it overflows
+        
+        Expired entries go first, then the least recently used ones down to
+        CACHE_LOW_WATER, so the sweep runs once per many inserts.
+        """
+        now = time.monotonic()
+        cache = self._cache
+        cache[key] = (now + ttl, data)
+        cache.move_to_end(key)
+        
+        if len(cache) > self.CACHE_MAX_ENTRIES:
+            for expired in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+                del cache[expired]
+            while len(cache) > self.CACHE_LOW_WATER:
+                cache.popitem(last=False)
+    
+    def _get_cache_db(self) -> Optional[sqlite3.Connection]:
+        """Open the persistent response cache on first use (cache thread only)"""
+        if self._cache_db is None and self.cache_path:
+            self._cache_db = sqlite3.connect(self.cache_path)
+            self._cache_db.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    expires_at REAL NOT NULL,
+                    body BLOB NOT NULL
+                )
+            """)
+        return self._cache_db
+    
+    def _persistent_lookup(self, key: str, include_expired: bool = False) -> Tuple[bool, Any, float]:
+        """Return (hit, data, remaining_ttl) from the persistent cache"""
+        db = self._get_cache_db()
+        if db is None:
+            return False, None, 0.0
+        row = db.execute(
+            "SELECT expires_at, body FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return False, None, 0.0
+        remaining = row[0] - time.time()
+        if remaining <= 0 and not include_expired:
+            return False, None, 0.0
+        return True, orjson.loads(row[1]), max(0.0, remaining)
+    
+    def _persistent_store(self, key: str, data: Any, ttl: float):
+        """Write a response to the persistent cache"""
+        db = self._get_cache_db()
+        if db is None:
+            return
+        with db:
+            db.execute(
+                "INSERT OR REPLACE INTO responses (key, expires_at, body) VALUES (?, ?, ?)",
+                (key, time.time() + ttl, orjson.dumps(data)),
+            )
+    
+    async def _cached_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: float = 0.0,
+    ) -> Any:
+        """
+        Make a request through the response cache
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            params: Query parameters
+            ttl: Cache lifetime in seconds (0 bypasses the cache unless the
+                policy records or replays responses)
+            
+        Returns:
+            JSON response data
+            
+        Raises:
+            CacheMiss: In replay mode when no cached response exists
+        """
+        policy = self.cache_policy
+        if policy == "disabled" or (ttl <= 0 and policy in ("enabled", "read_only")):
+            return await self._request(method, endpoint, params=params)
+        
+        replay = policy == "replay"
+        reads = policy != "write_only"
+        writes = policy in ("enabled", "write_only")
+        
+        key = self._cache_key(method, endpoint, params)
+        if reads:
+            hit, data = self._cache_lookup(key, include_expired=replay)
+            if hit:
+                return data
+        
+        # The lock stays registered while any caller holds or waits on it;
+        # the last one out removes it
+        lock = self._cache_locks.get(key)
+        if lock is None:
+            lock = self._cache_locks[key] = asyncio.Lock()
+        self._cache_lock_users[key] = self._cache_lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                redis_key = f"moralis:{key}"
+                if reads:
+                    # Another caller may have filled the entry while we waited
+                    hit, data = self._cache_lookup(key, include_expired=replay)
+                    if hit:
+                        return data
+                    
+                    if self.cache_path:
+                        hit, data, remaining = await self._run_cache_db(
+                            self._persistent_lookup, key, replay
+                        )
+                        if hit:
+                            self._cache_store(key, data, remaining)
+                            return data
+                    
+                    if self._redis is not None:
+                        try:
+                            raw = await self._redis.get(redis_key)
+                        except Exception as e:
+                            self.logger.debug("Redis cache read failed: %s", e)
+                            raw = None
+                        if raw is not None:
+                            data = orjson.loads(raw)
+                            self._cache_store(key, data, ttl)
+                            return data
+                
+                if replay:
+                    raise CacheMiss(f"No cached response for {method} {endpoint}")
+                
+                data = await self._request(method, endpoint, params=params)
+                
+                if writes:
+                    self._cache_store(key, data, ttl)
+                    if self.cache_path:
+                        await self._run_cache_db(self._persistent_store, key, data, ttl)
+                    
+                    if self._redis is not None and ttl > 0:
+                        try:
+                            await self._redis.setex(redis_key, int(ttl), orjson.dumps(data))
+                        except Exception as e:
+                            self.logger.debug("Redis cache write failed: %s", e)
+                
+                return data
+        finally:
+            users = self._cache_lock_users[key] - 1
+            if users:
+                self._cache_lock_users[key] = users
+            else:
+                del self._cache_lock_users[key]
+                del self._cache_locks[key]
+    
     async def get_pump_fun_tokens(
         self,
         limit: int = 100,
         offset: int = 0,
         sort_by: str = "created_at",
         order: str = "desc",
+        cursor: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get new pump.fun tokens from Moralis API
@@ -119,39 +509,173 @@ class MoralisClient:
         
         Args:
             limit: Number of tokens to retrieve (max 100)
-            offset: Pagination offset
+            offset: Pagination offset (ignored when cursor is given)
             sort_by: Sort field (created_at, market_cap, volume)
             order: Sort order (asc, desc)
+            cursor: Cursor returned with a previous page
             
         Returns:
             List of token data dictionaries
         """
-        params = {
-            "limit": min(limit, 100),
-            "offset": offset,
-        }
+        tokens, _ = await self.get_pump_fun_tokens_page(
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            order=order,
+            cursor=cursor,
+        )
+        return tokens
+    
+    async def get_pump_fun_tokens_page(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get one page of new pump.fun tokens along with the next-page cursor
+        
+        Args:
+            limit: Number of tokens to retrieve (max 100)
+            offset: Pagination offset (ignored when cursor is given)
+            sort_by: Sort field (created_at, market_cap, volume)
+            order: Sort order (asc, desc)
+            cursor: Cursor returned with a previous page
+            
+        Returns:
+            Tuple of (token data dictionaries, next cursor or None)
+        """
+        if cursor:
+            params: Dict[str, Any] = {"limit": min(limit, self.MAX_PAGE_SIZE), "cursor": cursor}
+        else:
+            params = self._page_params(limit, offset)
         
         try:
             # Moralis API endpoint for new pump.fun tokens
             # Based on: https://docs.moralis.com/web3-data-api/solana/tutorials/get-new-pump-fun-tokens
             endpoint = f"/token/mainnet/pumpfun/new"
-            data = await self._request("GET", endpoint, params=params)
+            data = await self._cached_request("GET", endpoint, params=params, ttl=self.listing_ttl)
             
             # Handle both list response and paginated response formats
             if isinstance(data, list):
-                return data
-            elif isinstance(data, dict) and "result" in data:
-                return data.get("result", [])
+                return data, None
+            
+            next_cursor = (data.get("cursor") or None) if isinstance(data, dict) else None
+            if isinstance(data, dict) and "result" in data:
+                return data.get("result", []), next_cursor
             elif isinstance(data, dict) and "data" in data:
-                return data.get("data", [])
+                return data.get("data", []), next_cursor
             elif isinstance(data, dict) and "tokens" in data:
-                return data.get("tokens", [])
+                return data.get("tokens", []), next_cursor
             else:
-                return []
+                return [], None
                 
+        except CacheMiss:
+            raise
         except Exception as e:
-            self.logger.error(f"Error fetching pump.fun tokens: {e}")
-            return []
+            self.logger.error("Error fetching pump.fun tokens: %s", e)
+            return [], None
+    
+    async def iter_pump_fun_token_pages(
+        self,
+        page_size: int = 100,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate over pump.fun token listing pages, prefetching the next page
+        while the current one is consumed
+        
+        Pages are chained by the cursor Moralis returns; offsets are only used
+        when a response carries no cursor. Callers that usually stop within
+        the first page should disable prefetching so the abandoned request
+        does not spend rate limit budget.
+        
+        Args:
+            page_size: Number of tokens per page (max 100)
+            sort_by: Sort field (created_at, market_cap, volume)
+            order: Sort order (asc, desc)
+            max_pages: Stop after this many pages (None for no limit)
+            prefetch: Request the next page before the current one is consumed
+            
+        Yields:
+            Non-empty lists of token data dictionaries in listing order
+        """
+        page_size = min(page_size, self.MAX_PAGE_SIZE)
+        offset = 0
+        pages = 0
+        next_task = asyncio.create_task(
+            self.get_pump_fun_tokens_page(limit=page_size, sort_by=sort_by, order=order)
+        )
+        
+        try:
+            while next_task is not None:
+                page, cursor = await next_task
+                next_task = None
+                pages += 1
+                
+                next_page: Optional[Dict[str, Any]] = None
+                if page and (max_pages is None or pages < max_pages):
+                    if cursor:
+                        next_page = {"cursor": cursor}
+                    elif len(page) >= page_size:
+                        # Without a cursor a short page means the listing is exhausted
+                        offset += page_size
+                        next_page = {"offset": offset}
+                
+                if next_page is not None and prefetch:
+                    next_task = asyncio.create_task(
+                        self.get_pump_fun_tokens_page(
+                            limit=page_size, sort_by=sort_by, order=order, **next_page
+                        )
+                    )
+                
+                if page:
+                    yield page
+                
+                if next_page is not None and not prefetch:
+                    next_task = asyncio.create_task(
+                        self.get_pump_fun_tokens_page(
+                            limit=page_size, sort_by=sort_by, order=order, **next_page
+                        )
+                    )
+        finally:
+            if next_task is not None and not next_task.done():
+                next_task.cancel()
+    
+    async def iter_pump_fun_tokens(
+        self,
+        page_size: int = 100,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over pump.fun tokens row by row across listing pages
+        
+        Takes the same arguments as iter_pump_fun_token_pages.
+        
+        Yields:
+            Token data dictionaries in listing order
+        """
+        pages = self.iter_pump_fun_token_pages(
+            page_size=page_size,
+            sort_by=sort_by,
+            order=order,
+            max_pages=max_pages,
+            prefetch=prefetch,
+        )
+        try:
+            async for page in pages:
+                for row in page:
+                    yield row
+        finally:
+            await pages.aclose()
     
     async def get_token_metadata(self, mint_address: str) -> Optional[Dict[str, Any]]:
         """
@@ -167,10 +691,12 @@ class MoralisClient:
         """
         try:
             endpoint = f"/token/mainnet/{mint_address}/metadata"
-            data = await self._request("GET", endpoint)
+            data = await self._cached_request("GET", endpoint, ttl=self.METADATA_CACHE_TTL)
             return data
+        except CacheMiss:
+            raise
         except Exception as e:
-            self.logger.error(f"Error fetching token metadata for {mint_address}: {e}")
+            self.logger.error("Error fetching token metadata for %s: %s", mint_address, e)
             return None
     
     async def get_token_price(self, mint_address: str) -> Optional[Dict[str, Any]]:
@@ -187,16 +713,21 @@ class MoralisClient:
         """
         try:
             endpoint = f"/token/mainnet/{mint_address}/price"
-            data = await self._request("GET", endpoint)
+            data = await self._cached_request("GET", endpoint, ttl=self.PRICE_CACHE_TTL)
             return data
+        except CacheMiss:
+            raise
         except Exception as e:
-            self.logger.error(f"Error fetching token price for {mint_address}: {e}")
+            self.logger.error("Error fetching token price for %s: %s", mint_address, e)
             return None
     
     async def get_token_details(self, mint_address: str) -> Optional[Dict[str, Any]]:
         """
         Get detailed information for a specific token (metadata + price)
         
+        Unknown mints fetch metadata first and skip the price request when the
+        mint does not resolve. Mints that resolved before fetch both in parallel.
+        
         Args:
             mint_address: Token mint address
             
@@ -204,13 +735,24 @@ class MoralisClient:
             Combined token details dictionary or None
         """
         try:
-            # Fetch metadata and price in parallel
-            metadata_task = self.get_token_metadata(mint_address)
-            price_task = self.get_token_price(mint_address)
-            
-            metadata, price_data = await asyncio.gather(
-                metadata_task, price_task, return_exceptions=True
-            )
+            if mint_address in self._known_mints:
+                self._known_mints.move_to_end(mint_address)
+                metadata, price_data = await asyncio.gather(
+                    self.get_token_metadata(mint_address),
+                    self.get_token_price(mint_address),
+                    return_exceptions=True,
+                )
+                for result in (metadata, price_data):
+                    if isinstance(result, CacheMiss):
+                        raise result
+            else:
+                metadata = await self.get_token_metadata(mint_address)
+                if not metadata:
+                    return None
+                self._known_mints[mint_address] = None
+                if len(self._known_mints) > self.KNOWN_MINTS_SIZE:
+                    self._known_mints.popitem(last=False)
+                price_data = await self.get_token_price(mint_address)
             
             # Combine metadata and price data
             combined = {}
@@ -220,10 +762,71 @@ class MoralisClient:
                 combined.update(price_data)
             
             return combined if combined else None
+        except CacheMiss:
+            raise
         except Exception as e:
-            self.logger.error(f"Error fetching token details for {mint_address}: {e}")
+            self.logger.error("Error fetching token details for %s: %s", mint_address, e)
             return None
     
+    def _token_details_cached(self, mint_address: str) -> bool:
+        """Check whether metadata and price for a mint are both cached"""
+        return all(
+            self._cache_lookup(self._cache_key("GET", endpoint, None))[0]
+            for endpoint in (
+                f"/token/mainnet/{mint_address}/metadata",
+                f"/token/mainnet/{mint_address}/price",
+            )
+        )
+    
+    async def get_token_details_bulk(
+        self,
+        mint_addresses: List[str],
+        concurrency: int = 20,
+        return_exceptions: bool = True,
+    ) -> List[Any]:
+        """
+        Get token details for many mints concurrently
+        
+        The requests are issued together and share the HTTP/2 connection, so
+        a page of 100 mints costs roughly one round trip per concurrency
+        window instead of one per mint.
+        
+        Args:
+            mint_addresses: Token mint addresses
+            concurrency: Maximum number of mints fetched at once
+            return_exceptions: Leave exceptions in the result list, as
+                asyncio.gather does; when False, log them and return None in
+                their place (CacheMiss is still raised)
+            
+        Returns:
+            List of details dictionaries (or None/exception) in input order
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def fetch_one(mint_address: str) -> Optional[Dict[str, Any]]:
+            # Cached mints resolve immediately without taking a slot
+            if self._token_details_cached(mint_address):
+                return await self.get_token_details(mint_address)
+            async with semaphore:
+                return await self.get_token_details(mint_address)
+        
+        results = await asyncio.gather(
+            *(fetch_one(mint_address) for mint_address in mint_addresses),
+            return_exceptions=True,
+        )
+        if return_exceptions:
+            return results
+        
+        for index, result in enumerate(results):
+            if isinstance(result, CacheMiss):
+                raise result
+            if isinstance(result, BaseException):
+                self.logger.error(
+                    "Error fetching token details for %s: %s", mint_addresses[index], result
+                )
+                results[index] = None
+        return results
+    
     async def get_token_swaps(
         self,
         mint_address: Optional[str] = None,
@@ -254,7 +857,7 @@ class MoralisClient:
             )
         
         params = {
-            "limit": min(limit, 100),
+            "limit": min(limit, self.MAX_PAGE_SIZE),
         }
         
         if offset:
@@ -270,7 +873,7 @@ class MoralisClient:
         
         try:
             endpoint = f"/token/{self.NETWORK}/{mint_address}/swaps"
-            data = await self._request("GET", endpoint, params=params)
+            data = await self._cached_request("GET", endpoint, params=params)
             
             if isinstance(data, list):
                 return data
@@ -283,8 +886,10 @@ class MoralisClient:
             else:
                 return []
                 
+        except CacheMiss:
+            raise
         except Exception as e:
-            self.logger.error(f"Error fetching token swaps for {mint_address}: {e}")
+            self.logger.error("Error fetching token swaps for %s: %s", mint_address, e)
             return []
     
     async def get_token_trades(
@@ -324,16 +929,19 @@ class MoralisClient:
         Returns:
             List of new token data dictionaries
         """
+        # from_date is part of the cache key, so round it down to the cache
+        # TTL (at least a minute) or the key would change every second
+        step = max(60, int(self.listing_ttl))
         from_date = datetime.now() - timedelta(hours=hours_back)
         
         params = {
-            "limit": min(limit, 100),
-            "from_date": int(from_date.timestamp()),
+            "limit": min(limit, self.MAX_PAGE_SIZE),
+            "from_date": int(from_date.timestamp()) // step * step,
         }
         
         try:
             endpoint = "/token/mainnet/pumpfun/new"
-            data = await self._request("GET", endpoint, params=params)
+            data = await self._cached_request("GET", endpoint, params=params, ttl=self.listing_ttl)
             
             if isinstance(data, list):
                 return data
@@ -346,8 +954,10 @@ class MoralisClient:
             else:
                 return []
                 
+        except CacheMiss:
+            raise
         except Exception as e:
-            self.logger.error(f"Error fetching new tokens: {e}")
+            self.logger.error("Error fetching new tokens: %s", e)
             return []
     
     async def get_graduated_tokens(
@@ -367,14 +977,11 @@ class MoralisClient:
         Returns:
             List of graduated token data dictionaries
         """
-        params = {
-            "limit": min(limit, 100),
-            "offset": offset,
-        }
+        params = self._page_params(limit, offset)
         
         try:
             endpoint = "/token/mainnet/pumpfun/graduated"
-            data = await self._request("GET", endpoint, params=params)
+            data = await self._cached_request("GET", endpoint, params=params, ttl=self.listing_ttl)
             
             if isinstance(data, list):
                 return data
@@ -387,8 +994,10 @@ class MoralisClient:
             else:
                 return []
                 
+        except CacheMiss:
+            raise
         except Exception as e:
-            self.logger.error(f"Error fetching graduated tokens: {e}")
+            self.logger.error("Error fetching graduated tokens: %s", e)
             return []
     
     async def get_bonding_tokens(
@@ -408,14 +1017,11 @@ class MoralisClient:
         Returns:
             List of bonding token data dictionaries
         """
-        params = {
-            "limit": min(limit, 100),
-            "offset": offset,
-        }
+        params = self._page_params(limit, offset)
         
         try:
             endpoint = "/token/mainnet/pumpfun/bonding"
-            data = await self._request("GET", endpoint, params=params)
+            data = await self._cached_request("GET", endpoint, params=params, ttl=self.listing_ttl)
             
             if isinstance(data, list):
                 return data
@@ -428,8 +1034,10 @@ class MoralisClient:
             else:
                 return []
                 
+        except CacheMiss:
+            raise
         except Exception as e:
-            self.logger.error(f"Error fetching bonding tokens: {e}")
+            self.logger.error("Error fetching bonding tokens: %s", e)
             return []
     
     async def get_token_bonding_status(self, mint_address: str) -> Optional[Dict[str, Any]]:
@@ -446,10 +1054,12 @@ class MoralisClient:
         """
         try:
             endpoint = f"/token/mainnet/{mint_address}/bonding-status"
-            data = await self._request("GET", endpoint)
+            data = await self._cached_request("GET", endpoint)
             return data
+        except CacheMiss:
+            raise
         except Exception as e:
-            self.logger.error(f"Error fetching bonding status for {mint_address}: {e}")
+            self.logger.error("Error fetching bonding status for %s: %s", mint_address, e)
             return None
     
     def parse_token(self, data: Dict[str, Any]) -> Optional[TokenInfo]:
@@ -462,132 +1072,75 @@ class MoralisClient:
         Returns:
             TokenInfo instance or None if parsing fails
         """
+        if not isinstance(data, dict):
+            self.logger.warning("Skipping token row that is not an object: %r", data)
+            return None
+        
         try:
-            # Extract mint address (required field)
-            mint_address = (
-                data.get("mint") or
-                data.get("address") or
-                data.get("mint_address") or
-                data.get("token_address")
-            )
-            
-            if not mint_address:
-                self.logger.debug("Skipping token without mint address")
-                return None
-            
-            # Parse timestamp
-            created_timestamp = None
-            timestamp_value = (
-                data.get("created_at") or
-                data.get("created_timestamp") or
-                data.get("creation_time") or
-                data.get("launch_time")
-            )
-            
-            if timestamp_value:
-                if isinstance(timestamp_value, (int, float)):
-                    created_timestamp = datetime.fromtimestamp(timestamp_value)
-                elif isinstance(timestamp_value, str):
-                    try:
-                        created_timestamp = datetime.fromisoformat(timestamp_value.replace("Z", "+00:00"))
-                    except (ValueError, AttributeError):
-                        pass
-            
-            # Get metadata if nested
-            metadata = data.get("metadata") or data.get("token_metadata") or {}
-            
-            # Extract token information
-            token = TokenInfo(
-                name=data.get("name") or metadata.get("name") or "",
-                symbol=data.get("symbol") or metadata.get("symbol") or "",
-                price=float(data.get("price_usd") or data.get("price") or 0),
-                market_cap=float(data.get("market_cap") or data.get("market_cap_usd") or 0),
-                volume_24h=float(data.get("volume_24h") or data.get("volume_24h_usd") or 0),
-                created_timestamp=created_timestamp,
-                mint_address=mint_address,
-                description=data.get("description") or metadata.get("description") or "",
-                image_uri=data.get("image") or data.get("image_uri") or metadata.get("image") or "",
-                twitter=data.get("twitter") or data.get("twitter_url") or "",
-                telegram=data.get("telegram") or data.get("telegram_url") or "",
-                website=data.get("website") or data.get("website_url") or "",
-            )
+            token = self._token_parser(data)
+        except ValidationError as e:
+            self.logger.warning("Error parsing token data: %s", e)
+            return None
+        
+        if token is None:
+            self.logger.debug("Skipping token without mint address")
+        return token
+    
+    def parse_tokens_batch(self, rows: List[Dict[str, Any]]) -> List[TokenInfo]:
+        """
+        Parse a page of Moralis token rows, dropping rows that fail to parse
+        
+        Args:
+            rows: Raw token data from a Moralis listing response
             
-            return token
+        Returns:
+            List of parsed TokenInfo instances in response order
+        """
+        if self._token_parser is parse_token_row and rows and isinstance(rows[0], dict):
+            self._token_parser = build_token_parser(rows[0])
+        
+        parse = self.parse_token
+        return [token for token in map(parse, rows) if token is not None]
+    
+    def parse_transactions_batch(self, rows: List[Dict[str, Any]]) -> List[TransactionData]:
+        """
+        Parse a page of Moralis trade rows, dropping rows that fail to parse
+        
+        Args:
+            rows: Raw trade data from a Moralis swaps response
             
-        except Exception as e:
-            self.logger.error(f"Error parsing token data: {e}")
-            return None
+        Returns:
+            List of parsed TransactionData instances in response order
+        """
+        now = datetime.now()
+        parse = self.parse_transaction
+        return [tx for tx in (parse(row, now) for row in rows) if tx is not None]
     
-    def parse_transaction(self, data: Dict[str, Any]) -> Optional[TransactionData]:
+    def parse_transaction(
+        self,
+        data: Dict[str, Any],
+        now: Optional[datetime] = None,
+    ) -> Optional[TransactionData]:
         """
         Parse Moralis API response data into TransactionData model
         
         Args:
             data: Raw transaction/trade data from Moralis API
+            now: Fallback timestamp for rows without a parseable time
             
         Returns:
             TransactionData instance or None if parsing fails
         """
+        if not isinstance(data, dict):
+            self.logger.warning("Skipping transaction row that is not an object: %r", data)
+            return None
+        
         try:
-            # Extract signature (required field)
-            signature = (
-                data.get("signature") or
-                data.get("transaction_hash") or
-                data.get("tx_hash") or
-                data.get("id")
-            )
-            
-            token_mint = (
-                data.get("token") or
-                data.get("token_address") or
-                data.get("mint") or
-                data.get("mint_address")
-            )
-            
-            if not signature or not token_mint:
-                self.logger.debug("Skipping transaction without signature or token")
-                return None
-            
-            # Parse timestamp
-            timestamp = datetime.now()
-            timestamp_value = (
-                data.get("timestamp") or
-                data.get("block_time") or
-                data.get("time") or
-                data.get("created_at")
-            )
-            
-            if timestamp_value:
-                if isinstance(timestamp_value, (int, float)):
-                    timestamp = datetime.fromtimestamp(timestamp_value)
-                elif isinstance(timestamp_value, str):
-                    try:
-                        timestamp = datetime.fromisoformat(timestamp_value.replace("Z", "+00:00"))
-                    except (ValueError, AttributeError):
-                        pass
-            
-            # Determine action
-            action = (data.get("type") or data.get("side") or data.get("action") or "").lower()
-            if not action or action not in {"buy", "sell", "create"}:
-                if "buy" in str(action):
-                    action = "buy"
-                elif "sell" in str(action):
-                    action = "sell"
-                else:
-                    action = "trade"
-            
-            transaction = TransactionData(
-                signature=signature,
-                token_mint=token_mint,
-                action=action,
-                amount=float(data.get("amount") or data.get("token_amount") or 0),
-                price=float(data.get("price") or data.get("price_usd") or 0),
-                user=data.get("user") or data.get("trader") or data.get("wallet") or "",
-                timestamp=timestamp,
-            )
-            
-            return transaction
-            
-        except Exception as e:
-            self.logger.error(f"Error parsing transaction data: {e}")
+            transaction = parse_transaction_row(data, now)
+        except ValidationError as e:
+            self.logger.warning("Error parsing transaction data: %s", e)
             return None
+        
+        if transaction is None:
+            self.logger.debug("Skipping transaction without signature or token")
+        return transaction
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Row parsers for Moralis Pump.fun API responses
+
+The module is fully annotated so it can be compiled with mypyc
+(``mypyc moralis_parsers.py``). Python imports the compiled extension
+automatically when it sits next to this file and falls back to the
+pure-Python source otherwise.
+"""
+
+import re
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from models import TokenInfo, TransactionData
+
+
+# Field aliases seen across Moralis endpoints, in lookup priority order.
+# These tables are the single source; the per-field names below are bound
+# once at import so the parsers reuse the same tuple objects on every row.
+_TOKEN_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "mint_address": ("mint", "address", "mint_address", "token_address", "mintAddress", "tokenAddress"),
+    "created_timestamp": ("created_at", "created_timestamp", "creation_time", "launch_time"),
+    "metadata": ("metadata", "token_metadata"),
+    "price": ("price_usd", "price"),
+    "market_cap": ("market_cap", "market_cap_usd"),
+    "volume_24h": ("volume_24h", "volume_24h_usd"),
+    "image_uri": ("image", "image_uri"),
+    "twitter": ("twitter", "twitter_url"),
+    "telegram": ("telegram", "telegram_url"),
+    "website": ("website", "website_url"),
+}
+
+_TRANSACTION_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "signature": ("signature", "transaction_hash", "tx_hash", "id"),
+    "token_mint": ("token", "token_address", "mint", "mint_address"),
+    "timestamp": ("timestamp", "block_time", "time", "created_at"),
+    "action": ("type", "side", "action"),
+    "amount": ("amount", "token_amount"),
+    "price": ("price", "price_usd"),
+    "user": ("user", "trader", "wallet"),
+}
+
+MINT_KEYS = _TOKEN_ALIASES["mint_address"]
+CREATED_KEYS = _TOKEN_ALIASES["created_timestamp"]
+METADATA_KEYS = _TOKEN_ALIASES["metadata"]
+TOKEN_PRICE_KEYS = _TOKEN_ALIASES["price"]
+MARKET_CAP_KEYS = _TOKEN_ALIASES["market_cap"]
+VOLUME_KEYS = _TOKEN_ALIASES["volume_24h"]
+IMAGE_KEYS = _TOKEN_ALIASES["image_uri"]
+TWITTER_KEYS = _TOKEN_ALIASES["twitter"]
+TELEGRAM_KEYS = _TOKEN_ALIASES["telegram"]
+WEBSITE_KEYS = _TOKEN_ALIASES["website"]
+
+SIGNATURE_KEYS = _TRANSACTION_ALIASES["signature"]
+TX_MINT_KEYS = _TRANSACTION_ALIASES["token_mint"]
+TX_TIME_KEYS = _TRANSACTION_ALIASES["timestamp"]
+ACTION_KEYS = _TRANSACTION_ALIASES["action"]
+AMOUNT_KEYS = _TRANSACTION_ALIASES["amount"]
+TX_PRICE_KEYS = _TRANSACTION_ALIASES["price"]
+USER_KEYS = _TRANSACTION_ALIASES["user"]
+
+_ACTIONS: FrozenSet[str] = frozenset(("buy", "sell", "create"))
+
+
+# ISO-8601 timestamps as Moralis emits them: optional fraction, naive or "Z"
+_ISO_RE = re.compile(
+    r"(\d{4})-(\d\d)-(\d\d)[T ](\d\d):(\d\d):(\d\d)(?:\.(\d{1,6}))?(Z?)"
+)
+
+
+def _parse_ts(value: Any) -> Optional[datetime]:
+    """Parse a Unix or ISO-8601 timestamp, returning None if unparseable"""
+    if isinstance(value, (int, float)):
+        try:
+            return datetime.fromtimestamp(value)
+        except (OverflowError, OSError, ValueError):
+            return None
+    if not isinstance(value, str):
+        return None
+    
+    match = _ISO_RE.fullmatch(value)
+    if match:
+        year, month, day, hour, minute, second, fraction, zulu = match.groups()
+        try:
+            return datetime(
+                int(year), int(month), int(day),
+                int(hour), int(minute), int(second),
+                int(fraction.ljust(6, "0")) if fraction else 0,
+                timezone.utc if zulu else None,
+            )
+        except ValueError:
+            return None
+    
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _first(data: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """Return the first truthy value found under any of keys"""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
+
+
+def _to_float(value: Any) -> float:
+    """Coerce a raw field value to float, or 0.0 if falsy or malformed"""
+    if not value:
+        return 0.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _fnum(data: Dict[str, Any], keys: Tuple[str, ...]) -> float:
+    """Return the first truthy value under keys as a float, or 0.0 if missing or malformed"""
+    return _to_float(_first(data, keys))
+
+
+def token_fingerprint(data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Return the mint plus the fields that change between polls of a row"""
+    return (
+        _first(data, MINT_KEYS),
+        _first(data, TOKEN_PRICE_KEYS),
+        _first(data, MARKET_CAP_KEYS),
+        _first(data, VOLUME_KEYS),
+    )
+
+
+def parse_token_row(data: Dict[str, Any]) -> Optional[TokenInfo]:
+    """
+    Parse one Moralis token row into a TokenInfo model
+    
+    Args:
+        data: Raw token data from Moralis API
+        
+    Returns:
+        TokenInfo instance, or None when the row has no mint address
+        
+    Raises:
+        ValidationError: When a field has a type the model rejects
+    """
+    # Extract mint address (required field)
+    mint_address = _first(data, MINT_KEYS)
+    if not mint_address:
+        return None
+    
+    # Parse timestamp
+    timestamp_value = _first(data, CREATED_KEYS)
+    created_timestamp = _parse_ts(timestamp_value) if timestamp_value else None
+    
+    # Get metadata if nested
+    metadata = _first(data, METADATA_KEYS)
+    if not isinstance(metadata, dict):
+        metadata = {}
+    
+    return TokenInfo(
+        name=data.get("name") or metadata.get("name") or "",
+        symbol=data.get("symbol") or metadata.get("symbol") or "",
+        price=_fnum(data, TOKEN_PRICE_KEYS),
+        market_cap=_fnum(data, MARKET_CAP_KEYS),
+        volume_24h=_fnum(data, VOLUME_KEYS),
+        created_timestamp=created_timestamp,
+        mint_address=mint_address,
+        description=data.get("description") or metadata.get("description") or "",
+        image_uri=_first(data, IMAGE_KEYS) or metadata.get("image") or "",
+        twitter=_first(data, TWITTER_KEYS) or "",
+        telegram=_first(data, TELEGRAM_KEYS) or "",
+        website=_first(data, WEBSITE_KEYS) or "",
+    )
+
+
+def parse_transaction_row(
+    data: Dict[str, Any],
+    now: Optional[datetime] = None,
+) -> Optional[TransactionData]:
+    """
+    Parse one Moralis trade row into a TransactionData model
+    
+    Args:
+        data: Raw transaction/trade data from Moralis API
+        now: Fallback timestamp for rows without a parseable time
+        
+    Returns:
+        TransactionData instance, or None when the row has no signature or token
+        
+    Raises:
+        ValidationError: When a field has a type the model rejects
+    """
+    # Extract signature (required field)
+    signature = _first(data, SIGNATURE_KEYS)
+    token_mint = _first(data, TX_MINT_KEYS)
+    if not signature or not token_mint:
+        return None
+    
+    # Parse timestamp
+    timestamp_value = _first(data, TX_TIME_KEYS)
+    timestamp = _parse_ts(timestamp_value) if timestamp_value else None
+    
+    # Determine action
+    raw_action = _first(data, ACTION_KEYS)
+    action = "trade"
+    if isinstance(raw_action, str):
+        # The API usually sends lowercase already; skip the copy then
+        lowered: str = raw_action if raw_action.islower() else raw_action.lower()
+        if lowered in _ACTIONS:
+            action = lowered
+        elif "buy" in lowered:
+            action = "buy"
+        elif "sell" in lowered:
+            action = "sell"
+    
+    return TransactionData(
+        signature=signature,
+        token_mint=token_mint,
+        action=action,
+        amount=_fnum(data, AMOUNT_KEYS),
+        price=_fnum(data, TX_PRICE_KEYS),
+        user=_first(data, USER_KEYS) or "",
+        timestamp=timestamp or now or datetime.now(),
+    )
+
+
+TokenParser = Callable[[Dict[str, Any]], Optional[TokenInfo]]
+
+
+def _chain(keys: Tuple[str, ...], present: FrozenSet[str]) -> str:
+    """Source for the first-truthy lookup over the aliases present in a row"""
+    terms: List[str] = [f"data[{key!r}]" for key in keys if key in present]
+    return " or ".join(terms) if terms else "None"
+
+
+def build_token_parser(sample: Dict[str, Any]) -> TokenParser:
+    """
+    Generate a parse_token_row specialized to the key set of a sample row
+    
+    Moralis returns the same fields for every row of a deployment, so the
+    alias fallbacks can be resolved once: the generated function indexes
+    only the aliases the sample carries. Rows with a different key set are
+    handed to the generic parse_token_row, so results are always identical.
+    
+    Args:
+        sample: A raw token row from the current API schema
+        
+    Returns:
+        Parser with the same contract as parse_token_row
+    """
+    present = frozenset(sample)
+    
+    def text_field(key: str) -> str:
+        direct = f"data[{key!r}] or " if key in present else ""
+        return f"{direct}metadata.get({key!r}) or \"\""
+    
+    source = f"""
+def parse_token_specialized(data):
+    if data.keys() != KEYS:
+        return generic(data)
+    mint_address = {_chain(MINT_KEYS, present)}
+    if not mint_address:
+        return None
+    timestamp_value = {_chain(CREATED_KEYS, present)}
+    metadata = {_chain(METADATA_KEYS, present)}
+    if not isinstance(metadata, dict):
+        metadata = {{}}
+    return TokenInfo(
+        name={text_field("name")},
+        symbol={text_field("symbol")},
+        price=to_float({_chain(TOKEN_PRICE_KEYS, present)}),
+        market_cap=to_float({_chain(MARKET_CAP_KEYS, present)}),
+        volume_24h=to_float({_chain(VOLUME_KEYS, present)}),
+        created_timestamp=parse_ts(timestamp_value) if timestamp_value else None,
+        mint_address=mint_address,
+        description={text_field("description")},
+        image_uri={_chain(IMAGE_KEYS, present)} or metadata.get("image") or "",
+        twitter={_chain(TWITTER_KEYS, present)} or "",
+        telegram={_chain(TELEGRAM_KEYS, present)} or "",
+        website={_chain(WEBSITE_KEYS, present)} or "",
+    )
+"""
+    namespace: Dict[str, Any] = {
+        "KEYS": present,
+        "generic": parse_token_row,
+        "to_float": _to_float,
+        "parse_ts": _parse_ts,
+        "TokenInfo": TokenInfo,
+    }
+    exec(compile(source, "<moralis_parsers:token>", "exec"), namespace)
+    parser: TokenParser = namespace["parse_token_specialized"]
+    return parser
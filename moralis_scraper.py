@@ -10,13 +10,15 @@ import asyncio
 import logging
 import signal
 import time
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from config import ScraperConfig
 from models import TokenInfo, TransactionData
 from moralis_client import MoralisClient
-from utils.data_storage import DataStorage
+from moralis_parsers import token_fingerprint
+from utils.data_storage import DataStorage, file_stamp
 from utils.logger import setup_logger
 
 
@@ -26,7 +28,10 @@ class MoralisScraper:
     def __init__(self, config: ScraperConfig):
         self.config = config
         self.logger = setup_logger(__name__, config.log_level)
-        self.data_storage = DataStorage(config.output_directory)
+        self.data_storage = DataStorage(
+            config.output_directory,
+            strict_durability=config.sqlite_strict_durability,
+        )
         
         # Validate Moralis API key
         if not config.moralis_api_key:
@@ -35,15 +40,34 @@ class MoralisScraper:
                 "Get one at https://moralis.io and set it in config.yaml as 'moralis_api_key'"
             )
         
-        # Moralis client
+        # Moralis client, opened once in initialize() and reused across polls
         self.moralis_client: Optional[MoralisClient] = None
+        self._client_open = False
+        
+        # Data collection. Tokens and transactions are bounded LRU maps keyed
+        # by mint / signature so membership doubles as deduplication
+        self.collected_tokens: "OrderedDict[str, TokenInfo]" = OrderedDict()
+        self.collected_transactions: "OrderedDict[str, TransactionData]" = OrderedDict()
+        self.new_launches: Dict[str, TokenInfo] = {}
+        
+        # token_fingerprint() of the listing row each collected token was
+        # parsed from, so rows whose price and volume have not moved are skipped
+        self._token_fingerprints: Dict[str, Optional[Tuple[Any, ...]]] = {}
+        
+        # Quick mode zeroes the transaction settings; skip trade polling then
+        self._trades_enabled = (
+            self.config.transactions_per_token > 0
+            and self.config.max_tokens_for_transactions > 0
+        )
         
-        # Data collection
-        self.collected_tokens: Dict[str, TokenInfo] = {}
-        self.collected_transactions: List[TransactionData] = []
-        self.new_launches: List[TokenInfo] = []
-        self._seen_transaction_signatures: Set[str] = set()
-        self._seen_launch_mints: Set[str] = set()
+        # Keys changed since the last successful save
+        self._dirty_token_mints: Set[str] = set()
+        self._dirty_transaction_signatures: Set[str] = set()
+        self._dirty_launch_mints: Set[str] = set()
+        
+        # Dirty tokens pushed out of collected_tokens before they were saved;
+        # the next save still writes them to the database
+        self._evicted_dirty_tokens: Dict[str, TokenInfo] = {}
         
         # Statistics
         self.session_start = datetime.now()
@@ -51,20 +75,46 @@ class MoralisScraper:
         self.api_requests = 0
         self.api_errors = 0
         
+        # Periodic saves run in the background so they never delay a poll
+        self._save_task: Optional[asyncio.Task] = None
+        
         # Control
         self.should_continue = True
         self._shutdown_event = asyncio.Event()
-        self._setup_signal_handlers()
+        self._loop_signal_handlers = False
+    
+    def _handle_shutdown(self, signum: int):
+        """Stop polling after SIGINT/SIGTERM"""
+        self.logger.info(f"Received signal {signum}, initiating graceful shutdown...")
+        self.should_continue = False
+        self._shutdown_event.set()
     
     def _setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
-        def signal_handler(signum, frame):
-            self.logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-            self.should_continue = False
-            self._shutdown_event.set()
+        """Setup signal handlers for graceful shutdown
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        Handlers are registered on the running event loop so they run as
+        regular loop callbacks; platforms without loop signal support fall
+        back to signal.signal.
+        """
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self._handle_shutdown, signum)
+                self._loop_signal_handlers = True
+            except (NotImplementedError, RuntimeError):
+                signal.signal(
+                    signum,
+                    lambda received, frame: loop.call_soon_threadsafe(self._handle_shutdown, received),
+                )
+    
+    def _remove_signal_handlers(self):
+        """Restore default signal handling registered on the loop"""
+        if not self._loop_signal_handlers:
+            return
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(signum)
+        self._loop_signal_handlers = False
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -81,18 +131,32 @@ class MoralisScraper:
         self.logger.info(f"Moralis API URL: {self.config.moralis_base_url}")
         self.logger.info("Using Moralis Web3 Data API for Solana/Pump.fun")
         
+        self._setup_signal_handlers()
+        
         # Initialize Moralis client
+        # Listings are polled for new tokens, so they bypass the response cache
         self.moralis_client = MoralisClient(
             api_key=self.config.moralis_api_key,
             timeout=self.config.timeout_seconds,
-            logger=self.logger
+            logger=self.logger,
+            listing_ttl=0,
+            requests_per_minute=self.config.moralis_rate_limit_rpm,
+            burst_limit=self.config.moralis_rate_limit_burst,
+            cache_policy=self.config.moralis_cache_policy,
+            cache_path=self.config.moralis_cache_path,
         )
+        await self.moralis_client.__aenter__()
+        self._client_open = True
     
     async def cleanup(self):
         """Clean up resources"""
         self.should_continue = False
-        if self.moralis_client:
+        self._remove_signal_handlers()
+        await self._wait_for_save()
+        if self.moralis_client and self._client_open:
             await self.moralis_client.__aexit__(None, None, None)
+            self._client_open = False
+        await self.data_storage.close()
         self.logger.info("Scraper cleanup completed")
     
     async def fetch_and_process_tokens(self) -> int:
@@ -105,50 +169,99 @@ class MoralisScraper:
         try:
             self.logger.debug("Fetching tokens from Moralis API...")
             
-            async with self.moralis_client:
-                # Get tokens sorted by creation date (newest first)
-                raw_tokens = await self.moralis_client.get_pump_fun_tokens(
-                    limit=self.config.api_page_size,
-                    sort_by="created_at",
-                    order="desc",
+            # Walk the listing newest first. Once a page contains a mint we
+            # already hold, everything older was seen on an earlier poll, so no
+            # further pages are requested; most polls end inside the first
+            # page, hence no prefetching. Every row of the pages fetched is
+            # still checked, so known mints whose price or volume moved are
+            # refreshed
+            page_size = min(self.config.api_page_size, self.moralis_client.MAX_PAGE_SIZE)
+            known_tokens = self.collected_tokens
+            fingerprints = self._token_fingerprints
+            fresh_rows = []
+            fresh_fingerprints: Dict[Any, Tuple[Any, ...]] = {}
+            rows_seen = 0
+            pages_seen = 0
+            pages = self.moralis_client.iter_pump_fun_token_pages(
+                page_size=page_size,
+                sort_by="created_at",
+                order="desc",
+                max_pages=self.config.moralis_max_token_pages,
+                prefetch=False,
+            )
+            try:
+                async for page in pages:
+                    pages_seen += 1
+                    rows_seen += len(page)
+                    reached_known = False
+                    for raw_token in page:
+                        if not isinstance(raw_token, dict):
+                            self.logger.warning(f"Skipping token row that is not an object: {raw_token!r}")
+                            continue
+                        fingerprint = token_fingerprint(raw_token)
+                        raw_mint = fingerprint[0]
+                        if raw_mint in known_tokens:
+                            reached_known = True
+                            if fingerprints.get(raw_mint) == fingerprint:
+                                known_tokens.move_to_end(raw_mint)
+                                continue
+                        fresh_rows.append(raw_token)
+                        fresh_fingerprints[raw_mint] = fingerprint
+                    if reached_known:
+                        break
+            finally:
+                await pages.aclose()
+            
+            self.api_requests += max(1, pages_seen)
+            new_count = 0
+            
+            # Tokens created after the cutoff count as new launches. Timestamps
+            # parsed from "Z" strings are UTC-aware, so keep an aware twin
+            launch_cutoff = datetime.now() - timedelta(hours=self.config.new_launches_hours)
+            launch_cutoff_utc = launch_cutoff.astimezone(timezone.utc)
+            log_launches = self.logger.isEnabledFor(logging.INFO)
+            
+            for token in self.moralis_client.parse_tokens_batch(fresh_rows):
+                if not token.mint_address:
+                    continue
+                
+                # Check if this is a new token
+                is_new = token.mint_address not in self.collected_tokens
+                
+                # Check if it's a new launch (within configured timeframe)
+                created = token.created_timestamp
+                is_new_launch = created is not None and created > (
+                    launch_cutoff if created.tzinfo is None else launch_cutoff_utc
                 )
                 
-                self.api_requests += 1
-                new_count = 0
+                # Update collected tokens
+                self.collected_tokens[token.mint_address] = token
+                self.collected_tokens.move_to_end(token.mint_address)
+                fingerprints[token.mint_address] = fresh_fingerprints.get(token.mint_address)
+                if len(self.collected_tokens) > self.config.max_collected_tokens:
+                    evicted, evicted_token = self.collected_tokens.popitem(last=False)
+                    fingerprints.pop(evicted, None)
+                    if evicted in self._dirty_token_mints:
+                        self._dirty_token_mints.discard(evicted)
+                        self._evicted_dirty_tokens[evicted] = evicted_token
+                self._dirty_token_mints.add(token.mint_address)
                 
-                for raw_token in raw_tokens:
-                    token = self.moralis_client.parse_token(raw_token)
-                    
-                    if not token or not token.mint_address:
-                        continue
-                    
-                    # Check if this is a new token
-                    is_new = token.mint_address not in self.collected_tokens
-                    
-                    # Check if it's a new launch (within configured timeframe)
-                    is_new_launch = False
-                    if token.created_timestamp:
-                        age = datetime.now() - token.created_timestamp
-                        is_new_launch = age < timedelta(hours=self.config.new_launches_hours)
-                    
-                    # Update collected tokens
-                    self.collected_tokens[token.mint_address] = token
-                    
-                    # Add to new launches if applicable
-                    if is_new_launch and token.mint_address not in self._seen_launch_mints:
-                        self.new_launches.append(token)
-                        self._seen_launch_mints.add(token.mint_address)
+                # Add to new launches if applicable
+                if is_new_launch and token.mint_address not in self.new_launches:
+                    self.new_launches[token.mint_address] = token
+                    self._dirty_launch_mints.add(token.mint_address)
+                    if log_launches:
                         self.logger.info(
                             f"New token: {token.name or 'Unknown'} ({token.symbol}) - "
                             f"${token.price:.6f} | MC: ${token.market_cap:,.0f}"
                         )
-                    
-                    if is_new:
-                        new_count += 1
-                
-                self.logger.debug(f"Processed {len(raw_tokens)} tokens, {new_count} new")
-                return new_count
                 
+                if is_new:
+                    new_count += 1
+            
+            self.logger.debug(f"Processed {rows_seen} tokens, {new_count} new")
+            return new_count
+            
         except Exception as e:
             self.logger.error(f"Error fetching tokens: {e}")
             self.api_errors += 1
@@ -184,61 +297,59 @@ class MoralisScraper:
                 return 0
             
             max_tokens = max(1, self.config.max_tokens_for_transactions)
-            tokens_to_process = tokens_to_process[:max_tokens]
+            tokens_to_process = tokens_to_process[:min(max_tokens, limit)]
             
-            total_new_trades = 0
-            remaining_limit = limit
+            # Split the trade budget across tokens once, up front
+            per_token_limit = min(
+                self.config.transactions_per_token,
+                max(1, limit // len(tokens_to_process)),
+            )
+            semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
+            debug = self.logger.isEnabledFor(logging.DEBUG)
             
-            async with self.moralis_client:
-                for index, token in enumerate(tokens_to_process):
-                    if remaining_limit <= 0:
-                        break
-                    
-                    tokens_remaining = len(tokens_to_process) - index
-                    per_token_limit = self.config.transactions_per_token
-                    if remaining_limit:
-                        per_token_limit = min(
-                            self.config.transactions_per_token,
-                            max(1, remaining_limit // tokens_remaining)
+            async def fetch_token_trades(token: TokenInfo) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    if debug:
+                        self.logger.debug(
+                            "Fetching up to %s trades for token %s (%s)",
+                            per_token_limit,
+                            token.symbol or token.mint_address,
+                            token.mint_address,
                         )
-                    
-                    token_symbol = token.symbol or token.mint_address
-                    mint_address = token.mint_address
-                    self.logger.debug(
-                        "Fetching up to %s trades for token %s (%s)",
-                        per_token_limit,
-                        token_symbol,
-                        mint_address,
+                    return await self.moralis_client.get_token_trades(
+                        mint_address=token.mint_address,
+                        limit=per_token_limit,
                     )
-                    
-                    try:
-                        raw_trades = await self.moralis_client.get_token_trades(
-                            mint_address=mint_address,
-                            limit=per_token_limit,
-                        )
-                        self.api_requests += 1
-                    except Exception as token_error:
-                        self.logger.error(
-                            f"Trade fetch error for token {mint_address}: {token_error}"
-                        )
-                        self.api_errors += 1
-                        continue
-                    
-                    if remaining_limit:
-                        remaining_limit = max(0, remaining_limit - len(raw_trades))
-                    
-                    for raw_trade in raw_trades:
-                        transaction = self.moralis_client.parse_transaction(raw_trade)
-                        
-                        if not transaction or not transaction.signature:
-                            continue
-                        
-                        if transaction.signature in self._seen_transaction_signatures:
-                            continue
-                        
-                        self.collected_transactions.append(transaction)
-                        self._seen_transaction_signatures.add(transaction.signature)
-                        total_new_trades += 1
+            
+            results = await asyncio.gather(
+                *(fetch_token_trades(token) for token in tokens_to_process),
+                return_exceptions=True,
+            )
+            
+            total_new_trades = 0
+            collected = self.collected_transactions
+            for token, raw_trades in zip(tokens_to_process, results):
+                if isinstance(raw_trades, Exception):
+                    self.logger.error(
+                        f"Trade fetch error for token {token.mint_address}: {raw_trades}"
+                    )
+                    self.api_errors += 1
+                    continue
+                
+                self.api_requests += 1
+                
+                new_trades = {
+                    transaction.signature: transaction
+                    for transaction in self.moralis_client.parse_transactions_batch(raw_trades)
+                    if transaction.signature and transaction.signature not in collected
+                }
+                collected.update(new_trades)
+                self._dirty_transaction_signatures.update(new_trades)
+                total_new_trades += len(new_trades)
+            
+            # Evict the oldest transactions once the whole batch is in
+            for _ in range(len(collected) - self.config.max_collected_transactions):
+                collected.popitem(last=False)
             
             self.logger.debug(
                 f"Processed trades for {len(tokens_to_process)} tokens, {total_new_trades} new"
@@ -258,8 +369,8 @@ class MoralisScraper:
         save_interval = 20  # Save data every 20 seconds
         stats_interval = 30  # Show statistics every 30 seconds
         
-        last_save = time.time()
-        last_stats = time.time()
+        last_save = time.monotonic()
+        last_stats = time.monotonic()
         poll_count = 0
         
         self.logger.info(f"Starting continuous data collection (polling every {poll_interval}s)...")
@@ -267,32 +378,27 @@ class MoralisScraper:
         
         while self.should_continue:
             try:
-                poll_start = time.time()
+                poll_start = time.monotonic()
                 poll_count += 1
                 
-                # Fetch tokens and trades in parallel
-                token_task = self.fetch_and_process_tokens()
-                trade_task = self.fetch_and_process_trades()
-                
-                new_tokens, new_trades = await asyncio.gather(
-                    token_task,
-                    trade_task,
-                    return_exceptions=True
-                )
-                
-                # Handle exceptions from tasks
-                if isinstance(new_tokens, Exception):
-                    self.logger.error(f"Token fetch error: {new_tokens}")
-                    new_tokens = 0
-                if isinstance(new_trades, Exception):
-                    self.logger.error(f"Trade fetch error: {new_trades}")
-                    new_trades = 0
+                if self._trades_enabled:
+                    # Fetch tokens and trades in parallel
+                    new_tokens, new_trades = await asyncio.gather(
+                        self.fetch_and_process_tokens(),
+                        self.fetch_and_process_trades(),
+                        return_exceptions=True
+                    )
+                    
+                    # Handle exceptions from tasks
+                    new_tokens = self._count_or_zero(new_tokens, "Token fetch error")
+                    new_trades = self._count_or_zero(new_trades, "Trade fetch error")
+                else:
+                    new_tokens = await self.fetch_and_process_tokens()
                 
-                current_time = time.time()
+                current_time = time.monotonic()
                 
-                # Save data periodically
-                if current_time - last_save >= save_interval:
-                    await self._save_data()
+                # Save data periodically without blocking the next poll
+                if current_time - last_save >= save_interval and self._schedule_save():
                     last_save = current_time
                 
                 # Show statistics periodically
@@ -300,9 +406,14 @@ class MoralisScraper:
                     self._show_statistics()
                     last_stats = current_time
                 
-                # Calculate sleep time to maintain polling interval
-                poll_duration = time.time() - poll_start
-                sleep_time = max(0, poll_interval - poll_duration)
+                # Calculate sleep time to maintain polling interval, waiting
+                # longer when Moralis has asked us to back off
+                poll_duration = time.monotonic() - poll_start
+                sleep_time = max(
+                    0,
+                    poll_interval - poll_duration,
+                    self.moralis_client.next_allowed_at - time.monotonic(),
+                )
                 
                 if sleep_time > 0:
                     await asyncio.sleep(sleep_time)
@@ -316,33 +427,114 @@ class MoralisScraper:
         
         self.logger.info("Data collection stopped")
     
-    async def _save_data(self):
-        """Save collected data to storage"""
+    def _count_or_zero(self, result: Union[int, BaseException], label: str) -> int:
+        """Unwrap a gather result, re-raising cancellation and logging failures"""
+        if isinstance(result, Exception):
+            self.logger.error(f"{label}: {result}")
+            return 0
+        if isinstance(result, BaseException):
+            # CancelledError and friends must reach the polling loop
+            raise result
+        return result
+    
+    def _schedule_save(self) -> bool:
+        """Start a background save unless one is still running"""
+        if self._save_task is not None and not self._save_task.done():
+            return False
+        self._save_task = asyncio.create_task(self._save_data())
+        return True
+    
+    async def _wait_for_save(self):
+        """Wait for an in-flight background save to finish"""
+        if self._save_task is not None:
+            await self._save_task
+            self._save_task = None
+    
+    async def _save_data(self, full: bool = False):
+        """
+        Save collected data to storage
+        
+        Collections without changes since the last save are skipped, and only
+        changed rows go to the database. Snapshot files are still written in
+        full because the dashboard reads the latest one.
+        
+        Args:
+            full: Write every collection and every database row regardless
+                of what changed
+        """
+        dirty_tokens, self._dirty_token_mints = self._dirty_token_mints, set()
+        dirty_transactions, self._dirty_transaction_signatures = self._dirty_transaction_signatures, set()
+        dirty_launches, self._dirty_launch_mints = self._dirty_launch_mints, set()
+        evicted_tokens, self._evicted_dirty_tokens = self._evicted_dirty_tokens, {}
+        stamp = file_stamp()
+        
         try:
-            if self.collected_tokens:
-                tokens_list = list(self.collected_tokens.values())
-                await self.data_storage.save_tokens(
-                    tokens_list,
-                    format_type=self.config.output_format,
-                )
-                self.logger.debug(f"Saved {len(tokens_list)} tokens")
+            save_tokens = bool(evicted_tokens) or (
+                bool(self.collected_tokens) and bool(full or dirty_tokens)
+            )
+            save_transactions = bool(self.collected_transactions) and bool(full or dirty_transactions)
             
-            if self.collected_transactions:
-                await self.data_storage.save_transactions(
-                    self.collected_transactions,
+            if save_tokens or save_transactions:
+                # Both collections share one database commit
+                tokens_list = list(self.collected_tokens.values()) if save_tokens else []
+                transactions_list = (
+                    list(self.collected_transactions.values()) if save_transactions else []
+                )
+                changed_tokens = None if full or not save_tokens else [
+                    self.collected_tokens[mint]
+                    for mint in dirty_tokens
+                    if mint in self.collected_tokens
+                ]
+                # A mint collected again since its eviction is saved from
+                # collected_tokens, which holds the newer row
+                evicted_rows = [
+                    token
+                    for mint, token in evicted_tokens.items()
+                    if mint not in self.collected_tokens
+                ]
+                if evicted_rows:
+                    changed_tokens = evicted_rows + (
+                        tokens_list if changed_tokens is None else changed_tokens
+                    )
+                changed_transactions = None if full or not save_transactions else [
+                    self.collected_transactions[signature]
+                    for signature in dirty_transactions
+                    if signature in self.collected_transactions
+                ]
+                await self.data_storage.save_batch(
+                    tokens_list,
+                    transactions_list,
                     format_type=self.config.output_format,
+                    db_tokens=changed_tokens,
+                    db_transactions=changed_transactions,
+                    timestamp=stamp,
                 )
-                self.logger.debug(f"Saved {len(self.collected_transactions)} transactions")
+                if save_tokens:
+                    dirty_tokens = set()
+                    evicted_tokens = {}
+                    self.logger.debug(f"Saved {len(tokens_list)} tokens")
+                if save_transactions:
+                    dirty_transactions = set()
+                    self.logger.debug(f"Saved {len(transactions_list)} transactions")
             
-            if self.new_launches:
+            if self.new_launches and (full or dirty_launches):
                 await self.data_storage.save_new_launches(
-                    self.new_launches,
+                    list(self.new_launches.values()),
                     format_type=self.config.output_format,
+                    timestamp=stamp,
                 )
+                dirty_launches = set()
                 self.logger.debug(f"Saved {len(self.new_launches)} new launches")
                 
         except Exception as e:
             self.logger.error(f"Error saving data: {e}")
+        finally:
+            # Anything that was not persisted stays dirty for the next save
+            self._dirty_token_mints |= dirty_tokens
+            self._dirty_transaction_signatures |= dirty_transactions
+            self._dirty_launch_mints |= dirty_launches
+            for mint, token in evicted_tokens.items():
+                self._evicted_dirty_tokens.setdefault(mint, token)
     
     def _show_statistics(self):
         """Display current statistics"""
@@ -384,8 +576,9 @@ class MoralisScraper:
             # Run continuously until stopped
             await self.poll_data()
         
-        # Final save
-        await self._save_data()
+        # Final save, after any background save has finished writing
+        await self._wait_for_save()
+        await self._save_data(full=True)
         
         # Calculate session duration
         session_duration = (datetime.now() - self.session_start).total_seconds()
@@ -393,8 +586,8 @@ class MoralisScraper:
         # Prepare results
         results = {
             'tokens': list(self.collected_tokens.values()),
-            'transactions': self.collected_transactions,
-            'new_launches': self.new_launches,
+            'transactions': list(self.collected_transactions.values()),
+            'new_launches': list(self.new_launches.values()),
             'migrations': [],  # Moralis might not have migration events
             'statistics': {
                 'session_duration': session_duration,
@@ -3,22 +3,28 @@
 Simple CLI interface for the pump.fun scraper
 """
 
+from __future__ import annotations
+
 import asyncio
 import argparse
+import functools
+import os.path
 import sys
-from pathlib import Path
-
-from config import ScraperConfig
-from main import PumpPortalScraper
+from heapq import heappush, heapreplace
+from operator import itemgetter
+from typing import TYPE_CHECKING, List
 
-# Import Moralis scraper
-try:
+# The scraper stacks (pydantic, httpx, websockets) are imported on demand so
+# --help and argument errors return without loading them
+if TYPE_CHECKING:
+    from config import ScraperConfig
+    from main import PumpPortalScraper
     from moralis_scraper import MoralisScraper
-except ImportError:
-    MoralisScraper = None
 
 
-def main():
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser once per process"""
     parser = argparse.ArgumentParser(
         description="Pump.fun Data Scraper - Simple CLI Interface",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -96,14 +102,21 @@ Examples:
         help="Disable browser fallback (deprecated - now uses API)"
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    args = _build_parser().parse_args()
     
     # Check if config file exists
-    if not Path(args.config).exists():
+    if not os.path.isfile(args.config):
         print(f"Error: Configuration file '{args.config}' not found.")
         print("Run the main scraper first to create a default config file.")
         sys.exit(1)
     
+    from config import ScraperConfig
+    from utils import event_loop
+    
     # Load and modify configuration based on arguments
     try:
         config = ScraperConfig.load(args.config)
@@ -146,11 +159,13 @@ Examples:
     
     if args.quick:
         config.data_collection_duration = min(120, config.data_collection_duration)
+        config.transactions_per_token = 0
+        config.max_tokens_for_transactions = 0
         print(f"Quick mode: {config.data_collection_duration} second collection")
     
     # Run the scraper
     try:
-        asyncio.run(run_scraper(config, args))
+        event_loop.run(run_scraper(config, args))
     except KeyboardInterrupt:
         print("\nScraping interrupted by user.")
         sys.exit(1)
@@ -162,8 +177,14 @@ Examples:
 async def run_scraper(config: ScraperConfig, args):
     """Run the scraper with given configuration and arguments"""
     
-    # Determine which scraper to use
-    use_moralis = config.use_moralis and config.moralis_api_key and MoralisScraper is not None
+    # Determine which scraper to use, importing only that one
+    use_moralis = False
+    if config.use_moralis and config.moralis_api_key:
+        try:
+            from moralis_scraper import MoralisScraper
+            use_moralis = True
+        except ImportError:
+            pass
     
     if use_moralis:
         # Use Moralis scraper
@@ -188,6 +209,8 @@ async def run_scraper(config: ScraperConfig, args):
             print("   Get a Moralis API key at https://moralis.io for better reliability.")
             print()
         
+        from main import PumpPortalScraper
+        
         async with PumpPortalScraper(config) as scraper:
             print(f"Starting PumpPortal.fun WebSocket API scraper (legacy)...")
             print(f"WebSocket URL: {config.websocket_url}")
@@ -203,7 +226,71 @@ async def run_scraper(config: ScraperConfig, args):
             await run_pumpportal_scraper(scraper, config, args)
 
 
-async def run_moralis_scraper(scraper: 'MoralisScraper', config: ScraperConfig, args):
+def format_token_summary(tokens) -> List[str]:
+    """Format market cap statistics and the top 5 tokens in a single pass"""
+    out = []
+    total_market_cap = 0.0
+    highest_market_cap = 0.0
+    priced_count = 0
+    # Min-heap of (market_cap, -position, token); the position breaks ties in
+    # favour of earlier tokens and keeps TokenInfo out of the comparison.
+    # Once it holds five entries only a market cap strictly above the
+    # smallest can get in, so most tokens cost one float comparison
+    top = []
+    floor = float("-inf")
+    for position, token in enumerate(tokens):
+        market_cap = token.market_cap
+        if market_cap > 0:
+            total_market_cap += market_cap
+            priced_count += 1
+            if market_cap > highest_market_cap:
+                highest_market_cap = market_cap
+        
+        if market_cap > floor:
+            if len(top) < 5:
+                heappush(top, (market_cap, -position, token))
+                if len(top) == 5:
+                    floor = top[0][0]
+            else:
+                heapreplace(top, (market_cap, -position, token))
+                floor = top[0][0]
+    
+    if priced_count:
+        out.append(f"Average market cap: ${total_market_cap / priced_count:,.2f}")
+        out.append(f"Highest market cap: ${highest_market_cap:,.2f}")
+    
+    # Show top 5 tokens by market cap
+    top.sort(key=itemgetter(0, 1), reverse=True)
+    out.append(f"\nTop 5 Tokens by Market Cap:")
+    for i, (_, _, token) in enumerate(top, 1):
+        out.append(f"  {i}. {token.name} ({token.symbol}) - ${token.market_cap:,.2f}")
+    return out
+
+
+def format_transaction_summary(transactions) -> List[str]:
+    """Format the buy/sell breakdown in a single pass"""
+    out = []
+    buy_count = 0
+    sell_count = 0
+    total_buy_volume = 0.0
+    for tx in transactions:
+        action = tx.action
+        if action == 'buy':
+            buy_count += 1
+            total_buy_volume += tx.amount * tx.price
+        elif action == 'sell':
+            sell_count += 1
+    
+    out.append(f"\nTransaction Breakdown:")
+    out.append(f"  Buy transactions: {buy_count}")
+    out.append(f"  Sell transactions: {sell_count}")
+    
+    if buy_count:
+        out.append(f"  Total buy volume: ${total_buy_volume:,.2f}")
+    return out
+
+
+async def run_moralis_scraper(scraper: MoralisScraper, config: ScraperConfig, args):
     """Run Moralis scraper with given configuration"""
     
     if args.new_launches:
@@ -240,54 +327,38 @@ async def run_moralis_scraper(scraper: 'MoralisScraper', config: ScraperConfig,
                 print("Running continuous scrape...")
         
         results = await scraper.collect_data(duration_seconds=duration)
+        tokens = results['tokens']
+        transactions = results['transactions']
+        stats = results['statistics']
         
-        # Print results summary
-        print("\n" + "=" * 50)
-        print("SCRAPING RESULTS SUMMARY")
-        print("=" * 50)
+        # Print results summary, written to stdout in one call
+        out = []
+        out.append("\n" + "=" * 50)
+        out.append("SCRAPING RESULTS SUMMARY")
+        out.append("=" * 50)
         
-        print(f"API requests: {results['statistics']['api_requests']}")
-        print(f"Tokens collected: {len(results['tokens'])}")
-        print(f"Transactions collected: {len(results['transactions'])}")
-        print(f"New launches found: {len(results['new_launches'])}")
+        out.append(f"API requests: {stats['api_requests']}")
+        out.append(f"Tokens collected: {len(tokens)}")
+        out.append(f"Transactions collected: {len(transactions)}")
+        out.append(f"New launches found: {len(results['new_launches'])}")
         
-        if results['tokens']:
-            # Token statistics
-            market_caps = [t.market_cap for t in results['tokens'] if t.market_cap > 0]
-            if market_caps:
-                avg_market_cap = sum(market_caps) / len(market_caps)
-                print(f"Average market cap: ${avg_market_cap:,.2f}")
-                print(f"Highest market cap: ${max(market_caps):,.2f}")
-            
-            # Show top 5 tokens by market cap
-            top_tokens = sorted(results['tokens'], key=lambda x: x.market_cap, reverse=True)[:5]
-            print(f"\nTop 5 Tokens by Market Cap:")
-            for i, token in enumerate(top_tokens, 1):
-                print(f"  {i}. {token.name} ({token.symbol}) - ${token.market_cap:,.2f}")
+        if tokens:
+            out.extend(format_token_summary(tokens))
         
-        if results['transactions']:
-            # Transaction statistics
-            buy_txs = [tx for tx in results['transactions'] if tx.action == 'buy']
-            sell_txs = [tx for tx in results['transactions'] if tx.action == 'sell']
-            
-            print(f"\nTransaction Breakdown:")
-            print(f"  Buy transactions: {len(buy_txs)}")
-            print(f"  Sell transactions: {len(sell_txs)}")
-            
-            if buy_txs:
-                total_buy_volume = sum(tx.amount * tx.price for tx in buy_txs)
-                print(f"  Total buy volume: ${total_buy_volume:,.2f}")
+        if transactions:
+            out.extend(format_transaction_summary(transactions))
         
         # File locations
-        print(f"\nData saved to:")
-        print(f"  📁 Directory: {config.output_directory}/")
-        print(f"  📄 Format: {config.output_format}")
+        out.append(f"\nData saved to:")
+        out.append(f"  📁 Directory: {config.output_directory}/")
+        out.append(f"  📄 Format: {config.output_format}")
         
         # Session statistics
-        stats = results['statistics']
-        print(f"\nSession Statistics:")
-        print(f"  Duration: {stats['session_duration']:.1f} seconds")
-        print(f"  API errors: {stats['connection_errors']}")
+        out.append(f"\nSession Statistics:")
+        out.append(f"  Duration: {stats['session_duration']:.1f} seconds")
+        out.append(f"  API errors: {stats['connection_errors']}")
+        
+        sys.stdout.write("\n".join(out) + "\n")
     
     print("\n✓ Scraping completed successfully!")
 
@@ -331,73 +402,60 @@ async def run_pumpportal_scraper(scraper: PumpPortalScraper, config: ScraperConf
             print(f"Running comprehensive scrape (collecting for {collection_duration} seconds)...")
         
         results = await scraper.collect_data(duration_seconds=collection_duration)
+        tokens = results['tokens']
+        transactions = results['transactions']
+        new_launches = results['new_launches']
+        stats = results['statistics']
         
-        # Save collected data
-        if results['tokens']:
-            await scraper.data_storage.save_tokens(
-                results['tokens'],
+        # Save collected data; the three collections are written concurrently
+        saves = []
+        if tokens:
+            saves.append(scraper.data_storage.save_tokens(
+                tokens,
                 format_type=config.output_format,
-            )
-        if results['transactions']:
-            await scraper.data_storage.save_transactions(
-                results['transactions'],
+            ))
+        if transactions:
+            saves.append(scraper.data_storage.save_transactions(
+                transactions,
                 format_type=config.output_format,
-            )
-        if results['new_launches']:
-            await scraper.data_storage.save_new_launches(
-                results['new_launches'],
+            ))
+        if new_launches:
+            saves.append(scraper.data_storage.save_new_launches(
+                new_launches,
                 format_type=config.output_format,
-            )
+            ))
+        await asyncio.gather(*saves)
         
-        # Print results summary
-        print("\n" + "=" * 50)
-        print("SCRAPING RESULTS SUMMARY")
-        print("=" * 50)
+        # Print results summary, written to stdout in one call
+        out = []
+        out.append("\n" + "=" * 50)
+        out.append("SCRAPING RESULTS SUMMARY")
+        out.append("=" * 50)
         
-        print(f"Messages received: {results['statistics']['messages_received']}")
-        print(f"Tokens collected: {len(results['tokens'])}")
-        print(f"Transactions collected: {len(results['transactions'])}")
-        print(f"New launches found: {len(results['new_launches'])}")
-        print(f"Migration events: {len(results['migrations'])}")
+        out.append(f"Messages received: {stats['messages_received']}")
+        out.append(f"Tokens collected: {len(tokens)}")
+        out.append(f"Transactions collected: {len(transactions)}")
+        out.append(f"New launches found: {len(new_launches)}")
+        out.append(f"Migration events: {len(results['migrations'])}")
         
-        if results['tokens']:
-            # Token statistics
-            market_caps = [t.market_cap for t in results['tokens'] if t.market_cap > 0]
-            if market_caps:
-                avg_market_cap = sum(market_caps) / len(market_caps)
-                print(f"Average market cap: ${avg_market_cap:,.2f}")
-                print(f"Highest market cap: ${max(market_caps):,.2f}")
-            
-            # Show top 5 tokens by market cap
-            top_tokens = sorted(results['tokens'], key=lambda x: x.market_cap, reverse=True)[:5]
-            print(f"\nTop 5 Tokens by Market Cap:")
-            for i, token in enumerate(top_tokens, 1):
-                print(f"  {i}. {token.name} ({token.symbol}) - ${token.market_cap:,.2f}")
+        if tokens:
+            out.extend(format_token_summary(tokens))
         
-        if results['transactions']:
-            # Transaction statistics
-            buy_txs = [tx for tx in results['transactions'] if tx.action == 'buy']
-            sell_txs = [tx for tx in results['transactions'] if tx.action == 'sell']
-            
-            print(f"\nTransaction Breakdown:")
-            print(f"  Buy transactions: {len(buy_txs)}")
-            print(f"  Sell transactions: {len(sell_txs)}")
-            
-            if buy_txs:
-                total_buy_volume = sum(tx.amount * tx.price for tx in buy_txs)
-                print(f"  Total buy volume: ${total_buy_volume:,.2f}")
+        if transactions:
+            out.extend(format_transaction_summary(transactions))
         
         # File locations
-        print(f"\nData saved to:")
-        print(f"  📁 Directory: {config.output_directory}/")
-        print(f"  📄 Format: {config.output_format}")
+        out.append(f"\nData saved to:")
+        out.append(f"  📁 Directory: {config.output_directory}/")
+        out.append(f"  📄 Format: {config.output_format}")
         
         # Session statistics
-        stats = results['statistics']
-        print(f"\nSession Statistics:")
-        print(f"  Duration: {stats['session_duration']:.1f} seconds")
-        print(f"  Connection errors: {stats['connection_errors']}")
-        print(f"  Reconnection attempts: {stats['reconnection_attempts']}")
+        out.append(f"\nSession Statistics:")
+        out.append(f"  Duration: {stats['session_duration']:.1f} seconds")
+        out.append(f"  Connection errors: {stats['connection_errors']}")
+        out.append(f"  Reconnection attempts: {stats['reconnection_attempts']}")
+        
+        sys.stdout.write("\n".join(out) + "\n")
     
     print("\n✓ Scraping completed successfully!")
 
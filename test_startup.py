@@ -7,6 +7,7 @@ import asyncio
 import signal
 from main import PumpPortalScraper
 from config import ScraperConfig
+from utils import event_loop
 
 async def test_startup():
     """Test scraper startup and immediate shutdown"""
@@ -59,4 +60,4 @@ async def test_startup():
     print("Ready for production use: python main.py")
 
 if __name__ == "__main__":
-    asyncio.run(test_startup())
+    event_loop.run(test_startup())
@@ -0,0 +1,19 @@
+"""
+Shared pytest setup for the scraper tests
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Make the top-level scraper modules importable
+sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _run_from_repo_root(monkeypatch):
+    """Resolve config.yaml and the data directory against the repository root"""
+    monkeypatch.chdir(ROOT)
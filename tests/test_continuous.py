@@ -3,12 +3,12 @@
 Test script to verify continuous operation mode
 """
 
-import asyncio
-import sys
-from datetime import datetime
+import pytest
+
 from main import PumpPortalScraper
 from config import ScraperConfig
 
+@pytest.mark.asyncio
 async def test_continuous_mode():
     """Test that scraper can run in continuous mode and stop gracefully"""
     print("Testing continuous mode...")
@@ -52,6 +52,3 @@ async def test_continuous_mode():
     print("  • Stop gracefully on Ctrl+C")
     print("\nRun with: python main.py")
     print("Stop with: Ctrl+C")
-
-if __name__ == "__main__":
-    asyncio.run(test_continuous_mode())
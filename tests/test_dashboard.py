@@ -2,12 +2,7 @@
 """
 Test script to verify the dashboard works correctly.
 """
-import json
-import time
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent))
+import orjson
 
 from dashboard.app import create_app
 
@@ -38,7 +33,7 @@ def test_dashboard():
     print("\n2. Testing /api/data endpoint...")
     response = client.get('/api/data')
     assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-    data = json.loads(response.data)
+    data = orjson.loads(response.data)
     assert 'tokens' in data, "tokens key not found in response"
     assert 'generated_at' in data, "generated_at not found in response"
     print(f"   ✓ API returns data successfully")
@@ -64,7 +59,7 @@ def test_dashboard():
     print("\n4. Testing healthcheck endpoint...")
     response = client.get('/healthz')
     assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-    health = json.loads(response.data)
+    health = orjson.loads(response.data)
     assert health.get('status') == 'ok', "Healthcheck failed"
     print("   ✓ Healthcheck endpoint working")
     
@@ -77,15 +72,3 @@ def test_dashboard():
     print("  ✓ Last updated timestamp visible")
     print("  ✓ Clean, simple interface")
     return True
-
-if __name__ == '__main__':
-    try:
-        test_dashboard()
-    except AssertionError as e:
-        print(f"\n❌ Test failed: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
@@ -0,0 +1,84 @@
+"""
+Tests for the SQLite-backed DataStorage
+"""
+
+import sqlite3
+
+import pytest
+
+from models import TokenInfo
+from utils.data_storage import DataStorage
+
+
+# tokens table as created before mint_address became the only key
+_OLD_TOKENS_SQL = """
+    CREATE TABLE tokens (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT,
+        symbol TEXT,
+        price REAL,
+        market_cap REAL,
+        volume_24h REAL,
+        created_timestamp TIMESTAMP,
+        mint_address TEXT UNIQUE,
+        description TEXT,
+        image_uri TEXT,
+        twitter TEXT,
+        telegram TEXT,
+        website TEXT,
+        scraped_at TIMESTAMP,
+        UNIQUE(mint_address, scraped_at)
+    )
+"""
+
+
+def _unique_indexes(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return [
+            len(conn.execute(f"PRAGMA index_info('{name}')").fetchall())
+            for _, name, unique, _, _ in conn.execute("PRAGMA index_list(tokens)")
+            if unique
+        ]
+    finally:
+        conn.close()
+
+
+@pytest.mark.asyncio
+async def test_composite_token_key_is_dropped_in_place(tmp_path):
+    db_path = tmp_path / "pump_fun_data.db"
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute(_OLD_TOKENS_SQL)
+        conn.executemany(
+            "INSERT INTO tokens (id, name, symbol, price, mint_address, scraped_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (7, "Alpha", "A", 1.0, "mint-a", "2024-01-01 00:00:00"),
+                (9, "Beta", "B", 2.0, "mint-b", "2024-01-01 00:00:00"),
+            ],
+        )
+    conn.close()
+    assert sorted(_unique_indexes(db_path)) == [1, 2]
+    
+    storage = DataStorage(str(tmp_path))
+    try:
+        assert _unique_indexes(db_path) == [1]
+        
+        await storage.save_tokens(
+            [TokenInfo(name="Alpha", symbol="A", price=1.5, mint_address="mint-a")],
+            format_type="json",
+        )
+    finally:
+        await storage.close()
+    
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT id, name, price, mint_address FROM tokens ORDER BY id"
+        ).fetchall()
+    finally:
+        conn.close()
+    
+    # Ids survive the rebuild and the upsert updates the existing row
+    assert rows == [(7, "Alpha", 1.5, "mint-a"), (9, "Beta", 2.0, "mint-b")]
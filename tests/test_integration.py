@@ -3,13 +3,14 @@
 Integration test for continuous real-time scraping mode
 """
 
-import asyncio
-import os
-import time
 from pathlib import Path
+
+import pytest
+
 from main import PumpPortalScraper
 from config import ScraperConfig
 
+@pytest.mark.asyncio
 async def test_short_run():
     """Test that scraper works in continuous mode for a short period"""
     print("=" * 70)
@@ -74,6 +75,3 @@ async def test_short_run():
     print("  4. Data saves every 20 seconds to:")
     print(f"     {data_dir}/")
     print()
-
-if __name__ == "__main__":
-    asyncio.run(test_short_run())
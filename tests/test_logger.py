@@ -0,0 +1,39 @@
+"""
+Tests for the logging utilities
+"""
+
+import logging
+import time
+
+from utils.logger import RotatingFileHandler
+
+
+def _record(level, message):
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+def test_rotating_handler_flushes_after_quiet_period(tmp_path):
+    log_file = tmp_path / "scraper.log"
+    handler = RotatingFileHandler(str(log_file), flush_interval=0.05)
+    try:
+        handler.handle(_record(logging.INFO, "buffered"))
+        assert log_file.read_bytes() == b""
+        
+        # No further records arrive; the timer still writes the line out
+        deadline = time.monotonic() + 2
+        while not log_file.read_bytes() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert log_file.read_bytes() == b"buffered\n"
+    finally:
+        handler.close()
+
+
+def test_rotating_handler_flushes_warnings_immediately(tmp_path):
+    log_file = tmp_path / "scraper.log"
+    handler = RotatingFileHandler(str(log_file), flush_interval=60)
+    try:
+        handler.handle(_record(logging.INFO, "first"))
+        handler.handle(_record(logging.WARNING, "second"))
+        assert log_file.read_bytes() == b"first\nsecond\n"
+    finally:
+        handler.close()
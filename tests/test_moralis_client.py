@@ -0,0 +1,291 @@
+"""
+Tests for MoralisClient caching, throttling and parsing
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from moralis_client import CacheMiss, MoralisClient
+
+
+def _client(handler, **kwargs):
+    """Build a client whose requests are answered by ``handler``"""
+    kwargs.setdefault("requests_per_minute", 0)
+    client = MoralisClient(api_key="test-key", **kwargs)
+    client.client = httpx.AsyncClient(
+        base_url=MoralisClient.BASE_URL,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+async def _no_wait():
+    return None
+
+
+def test_cache_store_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(MoralisClient, "CACHE_MAX_ENTRIES", 4)
+    monkeypatch.setattr(MoralisClient, "CACHE_LOW_WATER", 3)
+    client = MoralisClient(api_key="test-key")
+    
+    for key in "abcd":
+        client._cache_store(key, key, ttl=60)
+    assert client._cache_lookup("a") == (True, "a")
+    
+    # Overflowing trims to the low-water mark, oldest use first
+    client._cache_store("e", "e", ttl=60)
+    assert list(client._cache) == ["d", "a", "e"]
+
+
+def test_cache_store_drops_expired_entries_first(monkeypatch):
+    monkeypatch.setattr(MoralisClient, "CACHE_MAX_ENTRIES", 3)
+    monkeypatch.setattr(MoralisClient, "CACHE_LOW_WATER", 3)
+    client = MoralisClient(api_key="test-key")
+    
+    client._cache_store("fresh", 1, ttl=60)
+    client._cache_store("stale", 2, ttl=-1)
+    client._cache_store("newer", 3, ttl=60)
+    client._cache_store("newest", 4, ttl=60)
+    assert list(client._cache) == ["fresh", "newer", "newest"]
+
+
+@pytest.mark.asyncio
+async def test_cached_request_single_flight_survives_late_arrivals():
+    in_flight = 0
+    peak = 0
+    
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return httpx.Response(200, json={"ok": True})
+    
+    client = _client(handler, cache_policy="write_only")
+    try:
+        first = asyncio.ensure_future(client._cached_request("GET", "/x", ttl=60))
+        second = asyncio.ensure_future(client._cached_request("GET", "/x", ttl=60))
+        await first
+        
+        # Arrives while the second caller holds the lock
+        await asyncio.sleep(0.02)
+        third = asyncio.ensure_future(client._cached_request("GET", "/x", ttl=60))
+        await asyncio.gather(second, third)
+    finally:
+        await client.client.aclose()
+    
+    assert peak == 1
+    assert client._cache_locks == {}
+    assert client._cache_lock_users == {}
+
+
+@pytest.mark.asyncio
+async def test_persistent_cache_runs_off_the_event_loop(tmp_path, monkeypatch):
+    cache_path = str(tmp_path / "responses.db")
+    threads = []
+    original_lookup = MoralisClient._persistent_lookup
+    
+    def lookup(self, *args):
+        threads.append(threading.current_thread().name)
+        return original_lookup(self, *args)
+    
+    monkeypatch.setattr(MoralisClient, "_persistent_lookup", lookup)
+    
+    def handler(request):
+        return httpx.Response(200, json={"price": 1.5})
+    
+    client = _client(handler, cache_path=cache_path)
+    try:
+        assert await client.get_token_price("mint") == {"price": 1.5}
+    finally:
+        await client.__aexit__(None, None, None)
+    
+    # Exit closes the connection and stops its worker thread
+    assert client._cache_db is None
+    assert client._cache_db_executor is None
+    assert not any(t.name.startswith("moralis-cache") for t in threading.enumerate())
+    
+    def offline(request):
+        raise AssertionError("replay must not reach the network")
+    
+    replay = _client(offline, cache_path=cache_path, cache_policy="replay")
+    try:
+        assert await replay.get_token_price("mint") == {"price": 1.5}
+    finally:
+        await replay.__aexit__(None, None, None)
+    
+    assert threads and all(name.startswith("moralis-cache") for name in threads)
+
+
+@pytest.mark.asyncio
+async def test_get_new_tokens_cache_key_is_stable():
+    requests = []
+    
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"result": [{"mint": "a"}]})
+    
+    client = _client(handler, listing_ttl=300)
+    try:
+        first = await client.get_new_tokens(hours_back=1)
+        second = await client.get_new_tokens(hours_back=1)
+    finally:
+        await client.client.aclose()
+    
+    assert first == second == [{"mint": "a"}]
+    assert len(requests) == 1
+    assert int(requests[0].url.params["from_date"]) % 300 == 0
+
+
+@pytest.mark.asyncio
+async def test_token_details_bulk_return_exceptions(monkeypatch):
+    client = MoralisClient(api_key="test-key")
+    
+    async def details(mint_address):
+        if mint_address == "bad":
+            raise RuntimeError("boom")
+        if mint_address == "uncached":
+            raise CacheMiss(mint_address)
+        return {"mint": mint_address}
+    
+    monkeypatch.setattr(client, "get_token_details", details)
+    
+    returned = await client.get_token_details_bulk(["a", "bad"])
+    assert returned[0] == {"mint": "a"}
+    assert isinstance(returned[1], RuntimeError)
+    
+    assert await client.get_token_details_bulk(["a", "bad"], return_exceptions=False) == [
+        {"mint": "a"},
+        None,
+    ]
+    
+    with pytest.raises(CacheMiss):
+        await client.get_token_details_bulk(["a", "uncached"], return_exceptions=False)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_caps_the_initial_burst():
+    assert MoralisClient(api_key="test-key")._bucket_capacity == 60
+    
+    client = _client(
+        lambda request: httpx.Response(200, json={}),
+        requests_per_minute=600,
+        burst_limit=2,
+    )
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for _ in range(3):
+        await client._acquire_request_token()
+    
+    # Two tokens are available at once, the third refills at 10 per second
+    assert loop.time() - started >= 0.09
+    await client.client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_replay_policy_raises_cache_miss_without_requests():
+    requests = []
+    
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={})
+    
+    client = _client(handler, cache_policy="replay")
+    try:
+        with pytest.raises(CacheMiss):
+            await client.get_token_price("mint")
+        
+        # Expired entries are still replayed
+        key = client._cache_key("GET", "/token/mainnet/mint/price", None)
+        client._cache_store(key, {"price": 2.0}, ttl=-1)
+        assert await client.get_token_price("mint") == {"price": 2.0}
+    finally:
+        await client.client.aclose()
+    
+    assert requests == []
+
+
+@pytest.mark.asyncio
+async def test_read_only_policy_serves_hits_but_never_writes():
+    requests = []
+    
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"price": 3.0})
+    
+    client = _client(handler, cache_policy="read_only")
+    cached_key = client._cache_key("GET", "/token/mainnet/cached/price", None)
+    client._cache_store(cached_key, {"price": 1.0}, ttl=60)
+    try:
+        assert await client.get_token_price("cached") == {"price": 1.0}
+        assert await client.get_token_price("fresh") == {"price": 3.0}
+        assert await client.get_token_price("fresh") == {"price": 3.0}
+    finally:
+        await client.client.aclose()
+    
+    assert len(requests) == 2
+    assert list(client._cache) == [cached_key]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_responses_push_back_the_next_request():
+    responses = [
+        httpx.Response(429),
+        httpx.Response(429),
+        httpx.Response(200, json={}, headers={"x-rate-limit-remaining": "0", "x-rate-limit-reset": "5"}),
+    ]
+    client = _client(lambda request: responses.pop(0), requests_per_minute=600)
+    # Keep the test fast: skip the waits the limiter would impose
+    client._acquire_request_token = _no_wait
+    try:
+        for expected_backoff in (1.0, 2.0):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client._request("GET", "/x")
+            delay = client.next_allowed_at - time.monotonic()
+            assert expected_backoff - 0.5 < delay <= expected_backoff
+        
+        # A success resets the backoff; an exhausted quota waits for the reset
+        await client._request("GET", "/x")
+        assert client._consecutive_rate_limits == 0
+        assert client._bucket_tokens == 0
+        assert 4.5 < client.next_allowed_at - time.monotonic() <= 5
+    finally:
+        await client.client.aclose()
+
+
+def test_parsers_skip_rows_that_are_not_objects():
+    client = MoralisClient(api_key="test-key")
+    
+    assert client.parse_token("abc") is None
+    tokens = client.parse_tokens_batch([None, {"mint": "mint-a", "name": "Alpha"}, "abc"])
+    assert [token.mint_address for token in tokens] == ["mint-a"]
+    
+    assert client.parse_transaction(["not", "a", "row"]) is None
+    transactions = client.parse_transactions_batch(
+        [None, {"signature": "sig", "token": "mint-a", "type": "buy"}]
+    )
+    assert [tx.signature for tx in transactions] == ["sig"]
+
+
+@pytest.mark.asyncio
+async def test_known_mints_are_bounded(monkeypatch):
+    monkeypatch.setattr(MoralisClient, "KNOWN_MINTS_SIZE", 2)
+    client = MoralisClient(api_key="test-key")
+    
+    async def metadata(mint_address):
+        return {"mint": mint_address}
+    
+    async def price(mint_address):
+        return {"usdPrice": 1.0}
+    
+    monkeypatch.setattr(client, "get_token_metadata", metadata)
+    monkeypatch.setattr(client, "get_token_price", price)
+    
+    for mint in ("a", "b", "a", "c"):
+        await client.get_token_details(mint)
+    assert list(client._known_mints) == ["a", "c"]
@@ -0,0 +1,55 @@
+"""
+Tests for the Moralis row parsers
+"""
+
+from datetime import datetime, timezone
+
+from moralis_parsers import build_token_parser, parse_token_row
+
+
+SAMPLE = {
+    "mint": "mint-a",
+    "name": "Alpha",
+    "symbol": "A",
+    "price_usd": "1.25",
+    "market_cap": 1250,
+    "volume_24h": None,
+    "created_at": "2024-01-02T03:04:05.5Z",
+    "metadata": {"description": "from metadata", "image": "https://img"},
+}
+
+
+def _fields(token):
+    """Every parsed field except the per-call scrape time"""
+    return None if token is None else token.model_dump(exclude={"scraped_at"})
+
+
+def test_specialized_parser_matches_generic_parser():
+    parser = build_token_parser(SAMPLE)
+    rows = [
+        SAMPLE,
+        dict(SAMPLE, mint="mint-b", price_usd="not a number", name=""),
+        dict(SAMPLE, mint=""),
+    ]
+    
+    for row in rows:
+        assert _fields(parser(row)) == _fields(parse_token_row(row))
+    
+    token = parser(SAMPLE)
+    assert token.price == 1.25
+    assert token.volume_24h == 0.0
+    assert token.description == "from metadata"
+    assert token.image_uri == "https://img"
+    assert token.created_timestamp == datetime(2024, 1, 2, 3, 4, 5, 500000, tzinfo=timezone.utc)
+    assert parser(rows[1]).price == 0.0
+    assert parser(rows[2]) is None
+
+
+def test_specialized_parser_falls_back_for_other_schemas():
+    parser = build_token_parser(SAMPLE)
+    row = {"token_address": "mint-c", "symbol": "C", "price": 4}
+    
+    token = parser(row)
+    assert token.mint_address == "mint-c"
+    assert token.price == 4.0
+    assert _fields(token) == _fields(parse_token_row(row))
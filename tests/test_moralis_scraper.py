@@ -0,0 +1,181 @@
+"""
+Tests for MoralisScraper polling against a mocked Moralis API
+"""
+
+import sqlite3
+
+import httpx
+import pytest
+
+from config import ScraperConfig
+from moralis_client import MoralisClient
+from moralis_scraper import MoralisScraper
+
+
+def _row(mint, price, created_at="2024-01-01T00:00:00Z"):
+    return {
+        "mint": mint,
+        "name": f"Token {mint}",
+        "symbol": mint.upper(),
+        "price_usd": price,
+        "market_cap": price * 1000,
+        "created_at": created_at,
+    }
+
+
+def _scraper(tmp_path, pages):
+    """Build a scraper whose client serves ``pages`` in turn, one per request"""
+    config = ScraperConfig(
+        moralis_api_key="test-key",
+        output_directory=str(tmp_path),
+        output_format="json",
+    )
+    scraper = MoralisScraper(config)
+    requests = []
+    
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"result": pages.pop(0)})
+    
+    client = MoralisClient(
+        api_key="test-key",
+        listing_ttl=0,
+        requests_per_minute=0,
+        cache_policy="disabled",
+    )
+    client.client = httpx.AsyncClient(
+        base_url=MoralisClient.BASE_URL,
+        transport=httpx.MockTransport(handler),
+    )
+    scraper.moralis_client = client
+    return scraper, requests
+
+
+@pytest.mark.asyncio
+async def test_known_mint_price_change_is_stored(tmp_path):
+    pages = [
+        [_row("a", 1.0), _row("b", 2.0)],
+        [_row("c", 3.0), _row("a", 1.0), _row("b", 2.5)],
+    ]
+    scraper, requests = _scraper(tmp_path, pages)
+    try:
+        assert await scraper.fetch_and_process_tokens() == 2
+        await scraper._save_data()
+        
+        assert await scraper.fetch_and_process_tokens() == 1
+        assert scraper.collected_tokens["b"].price == 2.5
+        assert scraper._dirty_token_mints == {"b", "c"}
+        await scraper._save_data()
+    finally:
+        await scraper.moralis_client.client.aclose()
+        await scraper.data_storage.close()
+    
+    # One page per poll: the known mints stop the walk
+    assert len(requests) == 2
+    
+    conn = sqlite3.connect(tmp_path / "pump_fun_data.db")
+    try:
+        prices = dict(conn.execute("SELECT mint_address, price FROM tokens"))
+    finally:
+        conn.close()
+    assert prices == {"a": 1.0, "b": 2.5, "c": 3.0}
+
+
+@pytest.mark.asyncio
+async def test_walk_follows_cursor_until_known_mint(tmp_path):
+    scraper, requests = _scraper(tmp_path, [])
+    scraper.collected_tokens["old"] = None
+    listing = {
+        None: {"result": [_row("n1", 1.0)], "cursor": "p2"},
+        "p2": {"result": [_row("n2", 1.0), _row("old", 1.0)], "cursor": "p3"},
+    }
+    
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=listing[request.url.params.get("cursor")])
+    
+    scraper.moralis_client.client = httpx.AsyncClient(
+        base_url=MoralisClient.BASE_URL,
+        transport=httpx.MockTransport(handler),
+    )
+    try:
+        assert await scraper.fetch_and_process_tokens() == 2
+    finally:
+        await scraper.moralis_client.client.aclose()
+        await scraper.data_storage.close()
+    
+    # The page holding the known mint ends the walk; p3 is never requested
+    assert [r.url.params.get("cursor") for r in requests] == [None, "p2"]
+    assert {"n1", "n2"} <= set(scraper.collected_tokens)
+
+
+@pytest.mark.asyncio
+async def test_saves_write_only_changed_rows(tmp_path, monkeypatch):
+    pages = [
+        [_row("a", 1.0), _row("b", 2.0)],
+        [_row("a", 1.0), _row("b", 2.5)],
+    ]
+    scraper, _ = _scraper(tmp_path, pages)
+    batches = []
+    
+    async def save_batch(tokens, transactions, **kwargs):
+        batches.append(([t.mint_address for t in tokens], kwargs["db_tokens"]))
+    
+    monkeypatch.setattr(scraper.data_storage, "save_batch", save_batch)
+    try:
+        await scraper.fetch_and_process_tokens()
+        await scraper._save_data()
+        
+        # Nothing changed since the last save
+        await scraper._save_data()
+        
+        await scraper.fetch_and_process_tokens()
+        await scraper._save_data()
+    finally:
+        await scraper.moralis_client.client.aclose()
+        await scraper.data_storage.close()
+    
+    assert len(batches) == 2
+    first_files, first_db = batches[0]
+    assert sorted(first_files) == ["a", "b"]
+    assert sorted(t.mint_address for t in first_db) == ["a", "b"]
+    
+    # Snapshot files stay complete; the database only gets the changed row
+    second_files, second_db = batches[1]
+    assert sorted(second_files) == ["a", "b"]
+    assert [(t.mint_address, t.price) for t in second_db] == [("b", 2.5)]
+
+
+@pytest.mark.asyncio
+async def test_rows_that_are_not_objects_are_skipped(tmp_path):
+    scraper, _ = _scraper(tmp_path, [[None, "abc", _row("a", 1.0), 42]])
+    try:
+        assert await scraper.fetch_and_process_tokens() == 1
+    finally:
+        await scraper.moralis_client.client.aclose()
+        await scraper.data_storage.close()
+    
+    assert list(scraper.collected_tokens) == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_tokens_evicted_before_a_save_still_reach_the_database(tmp_path):
+    pages = [[_row("a", 1.0), _row("b", 2.0), _row("c", 3.0)]]
+    scraper, _ = _scraper(tmp_path, pages)
+    scraper.config.max_collected_tokens = 2
+    try:
+        assert await scraper.fetch_and_process_tokens() == 3
+        assert len(scraper.collected_tokens) == 2
+        await scraper._save_data()
+    finally:
+        await scraper.moralis_client.client.aclose()
+        await scraper.data_storage.close()
+    
+    assert scraper._evicted_dirty_tokens == {}
+    
+    conn = sqlite3.connect(tmp_path / "pump_fun_data.db")
+    try:
+        mints = {row[0] for row in conn.execute("SELECT mint_address FROM tokens")}
+    finally:
+        conn.close()
+    assert mints == {"a", "b", "c"}
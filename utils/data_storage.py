@@ -2,64 +2,216 @@
 Data storage utilities for the pump.fun scraper
 """
 
-import json
+import asyncio
+import functools
 import csv
+import io
 import sqlite3
-import aiofiles
-from datetime import datetime
+import time
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
+from collections import OrderedDict
+
+from pydantic import TypeAdapter
 
 from models import TokenInfo, TransactionData
 
 
+# List adapters serialise a whole snapshot in one pydantic-core pass instead
+# of a model_dump() per item
+_LIST_ADAPTERS = {
+    TokenInfo: TypeAdapter(List[TokenInfo]),
+    TransactionData: TypeAdapter(List[TransactionData]),
+}
+
+_TOKEN_COLUMNS = (
+    "name", "symbol", "price", "market_cap", "volume_24h", "created_timestamp",
+    "mint_address", "description", "image_uri", "twitter", "telegram", "website",
+    "scraped_at",
+)
+
+_TRANSACTION_COLUMNS = (
+    "signature", "token_mint", "action", "amount", "price", "user_address",
+    "timestamp", "scraped_at",
+)
+
+# Row builders in column order; the model calls user_address plain ``user``
+_token_row = attrgetter(*_TOKEN_COLUMNS)
+_TOKEN_MINT_INDEX = _TOKEN_COLUMNS.index("mint_address")
+_transaction_row = attrgetter(*(
+    "user" if column == "user_address" else column for column in _TRANSACTION_COLUMNS
+))
+
+# The tokens table holds the latest row per mint. Upserting updates that row in
+# place instead of REPLACE's delete-and-reinsert
+_INSERT_TOKEN_SQL = (
+    f"INSERT INTO tokens ({', '.join(_TOKEN_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_TOKEN_COLUMNS))}) "
+    "ON CONFLICT(mint_address) DO UPDATE SET "
+    + ", ".join(
+        f"{column} = excluded.{column}"
+        for column in _TOKEN_COLUMNS
+        if column != "mint_address"
+    )
+)
+
+_CREATE_TOKENS_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT,
+        symbol TEXT,
+        price REAL,
+        market_cap REAL,
+        volume_24h REAL,
+        created_timestamp TIMESTAMP,
+        mint_address TEXT UNIQUE,
+        description TEXT,
+        image_uri TEXT,
+        twitter TEXT,
+        telegram TEXT,
+        website TEXT,
+        scraped_at TIMESTAMP
+    )
+"""
+
+_INSERT_TRANSACTION_SQL = (
+    f"INSERT OR IGNORE INTO transactions ({', '.join(_TRANSACTION_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_TRANSACTION_COLUMNS))})"
+)
+
+# Token and transaction aggregates for one day, as a single row
+_DAILY_SUMMARY_SQL = """
+    SELECT token_stats.*, tx_stats.*
+    FROM (
+        SELECT COUNT(*) as token_count,
+               AVG(market_cap) as avg_market_cap,
+               SUM(volume_24h) as total_volume
+        FROM tokens
+        WHERE scraped_at >= :start AND scraped_at < :end
+    ) AS token_stats, (
+        SELECT COUNT(*) as tx_count,
+               COUNT(DISTINCT token_mint) as unique_tokens,
+               SUM(CASE WHEN action = 'buy' THEN amount ELSE 0 END) as total_buys,
+               SUM(CASE WHEN action = 'sell' THEN amount ELSE 0 END) as total_sells
+        FROM transactions
+        WHERE scraped_at >= :start AND scraped_at < :end
+    ) AS tx_stats
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _format_stamp(second: int) -> str:
+    return datetime.fromtimestamp(second).strftime("%Y%m%d_%H%M%S")
+
+
+def file_stamp() -> str:
+    """Current time as a snapshot file-name stamp, formatted once per second"""
+    return _format_stamp(int(time.time()))
+
+
+# (table, columns, query) for each exported table; the surrogate id is left out
+_EXPORT_QUERIES = tuple(
+    (
+        table,
+        columns,
+        f"SELECT {', '.join(columns)} FROM {table} "
+        "WHERE scraped_at BETWEEN ? AND ? ORDER BY scraped_at DESC",
+    )
+    for table, columns in (
+        ("tokens", _TOKEN_COLUMNS),
+        ("transactions", _TRANSACTION_COLUMNS),
+    )
+)
+
+
 class DataStorage:
     """
     Handles saving scraped data in various formats
     """
     
-    def __init__(self, output_directory: str = "data"):
+    WRITTEN_TOKENS_CACHE_SIZE = 50_000
+    # Today's summary still moves; past days only change on late writes
+    SUMMARY_TTL_TODAY = 30.0
+    SUMMARY_TTL_PAST = 3600.0
+    
+    def __init__(
+        self,
+        output_directory: str = "data",
+        strict_durability: bool = False,
+    ):
+        """
+        Args:
+            output_directory: Directory receiving snapshots and the SQLite file
+            strict_durability: Use synchronous=FULL instead of NORMAL
+        """
         self.output_dir = Path(output_directory)
         self.output_dir.mkdir(exist_ok=True)
         
         # Create subdirectories
-        (self.output_dir / "tokens").mkdir(exist_ok=True)
-        (self.output_dir / "transactions").mkdir(exist_ok=True)
-        (self.output_dir / "launches").mkdir(exist_ok=True)
+        self._tokens_dir = self.output_dir / "tokens"
+        self._transactions_dir = self.output_dir / "transactions"
+        self._launches_dir = self.output_dir / "launches"
+        self._tokens_dir.mkdir(exist_ok=True)
+        self._transactions_dir.mkdir(exist_ok=True)
+        self._launches_dir.mkdir(exist_ok=True)
         (self.output_dir / "daily").mkdir(exist_ok=True)
         
         self.logger = logging.getLogger(__name__)
         
         # Initialize SQLite database
         self.db_path = self.output_dir / "pump_fun_data.db"
+        self._synchronous = "FULL" if strict_durability else "NORMAL"
+        # One connection for the lifetime of the storage keeps SQLite's page
+        # cache warm. All work on it runs on a single worker thread, which
+        # serialises access and keeps commits off the event loop
+        self._conn: Optional[sqlite3.Connection] = self._connect()
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        # Last row written per mint, so unchanged tokens skip the upsert
+        self._written_tokens: "OrderedDict[str, tuple]" = OrderedDict()
+        # Daily summary results by date, plus the query currently computing each
+        self._summary_cache: Dict[str, tuple] = {}
+        self._summary_inflight: Dict[str, asyncio.Future] = {}
         self._init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the per-connection tuning PRAGMAs applied"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute(f"PRAGMA synchronous={self._synchronous}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        return conn
+    
+    async def _run_db(self, func, *args):
+        """Run a blocking database call on the dedicated SQLite thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_executor, func, *args)
+    
+    async def close(self):
+        """Close the shared database connection and its worker thread"""
+        if self._conn is None:
+            return
+        await self._run_db(self._conn.close)
+        self._conn = None
+        self._db_executor.shutdown()
+    
     def _init_database(self):
         """Initialize SQLite database with tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn as conn:
             cursor = conn.cursor()
             
+            # WAL is stored in the database file, so later connections inherit it
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA wal_autocheckpoint=1000")
+            
             # Tokens table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tokens (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT,
-                    symbol TEXT,
-                    price REAL,
-                    market_cap REAL,
-                    volume_24h REAL,
-                    created_timestamp TIMESTAMP,
-                    mint_address TEXT UNIQUE,
-                    description TEXT,
-                    image_uri TEXT,
-                    twitter TEXT,
-                    telegram TEXT,
-                    website TEXT,
-                    scraped_at TIMESTAMP,
-                    UNIQUE(mint_address, scraped_at)
-                )
-            """)
+            cursor.execute(_CREATE_TOKENS_SQL.format(table="tokens"))
+            self._drop_composite_token_key(cursor)
             
             # Transactions table
             cursor.execute("""
@@ -82,29 +234,59 @@ class DataStorage:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_tokens_created ON tokens(created_timestamp)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_mint ON transactions(token_mint)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_timestamp ON transactions(timestamp)")
+            # Export and daily summary windows filter on scraped_at
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_tokens_scraped ON tokens(scraped_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_scraped ON transactions(scraped_at)")
             
             conn.commit()
             self.logger.info("Database initialized successfully")
     
-    async def save_tokens(self, tokens: List[TokenInfo], format_type: str = "both"):
-        """Save token data in specified format(s)"""
+    def _drop_composite_token_key(self, cursor: sqlite3.Cursor):
+        """Rebuild tokens created with the old UNIQUE(mint_address, scraped_at)
+        
+        mint_address is unique on its own, so the composite index only cost
+        an extra B-tree update per write. SQLite cannot drop a table constraint,
+        so older databases are copied into a fresh table once.
+        """
+        for _, name, unique, origin, _ in cursor.execute("PRAGMA index_list(tokens)").fetchall():
+            if unique and origin == "u" and len(
+                cursor.execute(f"PRAGMA index_info('{name}')").fetchall()
+            ) > 1:
+                break
+        else:
+            return
+        
+        columns = ", ".join(("id",) + _TOKEN_COLUMNS)
+        cursor.execute(_CREATE_TOKENS_SQL.format(table="tokens_rebuild"))
+        cursor.execute(f"INSERT INTO tokens_rebuild ({columns}) SELECT {columns} FROM tokens")
+        cursor.execute("DROP TABLE tokens")
+        cursor.execute("ALTER TABLE tokens_rebuild RENAME TO tokens")
+        self.logger.info("Dropped redundant UNIQUE(mint_address, scraped_at) from tokens")
+    
+    async def save_tokens(
+        self,
+        tokens: List[TokenInfo],
+        format_type: str = "both",
+        db_tokens: Optional[List[TokenInfo]] = None,
+        timestamp: Optional[str] = None,
+    ):
+        """Save token data in specified format(s)
+        
+        Files always receive the full ``tokens`` snapshot; ``db_tokens``, when
+        given, limits the database write to rows that changed. ``timestamp``
+        lets callers share one file stamp across a save cycle.
+        """
         if not tokens:
             self.logger.warning("No tokens to save")
             return
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or file_stamp()
         
         try:
-            # Save to JSON
-            if format_type in ["json", "both"]:
-                await self._save_tokens_json(tokens, timestamp)
-            
-            # Save to CSV
-            if format_type in ["csv", "both"]:
-                await self._save_tokens_csv(tokens, timestamp)
+            await self._save_token_files(tokens, format_type, timestamp)
             
             # Save to database
-            await self._save_tokens_db(tokens)
+            await self._save_tokens_db(tokens if db_tokens is None else db_tokens)
             
             self.logger.info(f"Successfully saved {len(tokens)} tokens")
             
@@ -112,25 +294,32 @@ class DataStorage:
             self.logger.error(f"Error saving tokens: {e}")
             raise
     
-    async def save_transactions(self, transactions: List[TransactionData], format_type: str = "both"):
-        """Save transaction data in specified format(s)"""
+    async def save_transactions(
+        self,
+        transactions: List[TransactionData],
+        format_type: str = "both",
+        db_transactions: Optional[List[TransactionData]] = None,
+        timestamp: Optional[str] = None,
+    ):
+        """Save transaction data in specified format(s)
+        
+        Files always receive the full ``transactions`` snapshot;
+        ``db_transactions``, when given, limits the database write to new rows.
+        ``timestamp`` lets callers share one file stamp across a save cycle.
+        """
         if not transactions:
             self.logger.warning("No transactions to save")
             return
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or file_stamp()
         
         try:
-            # Save to JSON
-            if format_type in ["json", "both"]:
-                await self._save_transactions_json(transactions, timestamp)
-            
-            # Save to CSV
-            if format_type in ["csv", "both"]:
-                await self._save_transactions_csv(transactions, timestamp)
+            await self._save_transaction_files(transactions, format_type, timestamp)
             
             # Save to database
-            await self._save_transactions_db(transactions)
+            await self._save_transactions_db(
+                transactions if db_transactions is None else db_transactions
+            )
             
             self.logger.info(f"Successfully saved {len(transactions)} transactions")
             
@@ -138,26 +327,70 @@ class DataStorage:
             self.logger.error(f"Error saving transactions: {e}")
             raise
     
-    async def save_new_launches(self, launches: List[TokenInfo], format_type: str = "both"):
+    async def save_batch(
+        self,
+        tokens: List[TokenInfo],
+        transactions: List[TransactionData],
+        format_type: str = "both",
+        db_tokens: Optional[List[TokenInfo]] = None,
+        db_transactions: Optional[List[TransactionData]] = None,
+        timestamp: Optional[str] = None,
+    ):
+        """Save tokens and transactions together with a single database commit
+        
+        Behaves like ``save_tokens`` followed by ``save_transactions``, except
+        that both sets of rows go to SQLite in one transaction. Either list may
+        be empty, in which case its files are not written.
+        """
+        timestamp = timestamp or file_stamp()
+        
+        try:
+            if tokens:
+                await self._save_token_files(tokens, format_type, timestamp)
+            if transactions:
+                await self._save_transaction_files(transactions, format_type, timestamp)
+            
+            token_rows = self._pending_token_rows(tokens if db_tokens is None else db_tokens)
+            transaction_rows = list(map(
+                _transaction_row,
+                transactions if db_transactions is None else db_transactions,
+            ))
+            await self._write_rows(
+                (_INSERT_TOKEN_SQL, token_rows),
+                (_INSERT_TRANSACTION_SQL, transaction_rows),
+            )
+            self._remember_token_rows(token_rows)
+            
+            self.logger.info(
+                f"Successfully saved {len(tokens)} tokens and {len(transactions)} transactions"
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Error saving batch: {e}")
+            raise
+    
+    async def save_new_launches(
+        self,
+        launches: List[TokenInfo],
+        format_type: str = "both",
+        timestamp: Optional[str] = None,
+    ):
         """Save new launch data"""
         if not launches:
             self.logger.warning("No new launches to save")
             return
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or file_stamp()
         
         try:
             # Save to JSON
             if format_type in ["json", "both"]:
-                filename = self.output_dir / "launches" / f"new_launches_{timestamp}.json"
-                data = [launch.model_dump(mode='json') for launch in launches]
-                
-                async with aiofiles.open(filename, "w") as f:
-                    await f.write(json.dumps(data, indent=2, default=str))
+                filename = self._launches_dir / f"new_launches_{timestamp}.json"
+                await self._write_json(filename, launches, TokenInfo)
             
             # Save to CSV
             if format_type in ["csv", "both"]:
-                filename = self.output_dir / "launches" / f"new_launches_{timestamp}.csv"
+                filename = self._launches_dir / f"new_launches_{timestamp}.csv"
                 await self._write_csv(filename, launches, TokenInfo)
             
             self.logger.info(f"Successfully saved {len(launches)} new launches")
@@ -166,181 +399,225 @@ class DataStorage:
             self.logger.error(f"Error saving new launches: {e}")
             raise
     
+    async def _save_token_files(self, tokens: List[TokenInfo], format_type: str, timestamp: str):
+        """Write the token snapshot files selected by ``format_type``"""
+        # Save to JSON
+        if format_type in ["json", "both"]:
+            await self._save_tokens_json(tokens, timestamp)
+        
+        # Save to CSV
+        if format_type in ["csv", "both"]:
+            await self._save_tokens_csv(tokens, timestamp)
+    
+    async def _save_transaction_files(
+        self, transactions: List[TransactionData], format_type: str, timestamp: str
+    ):
+        """Write the transaction snapshot files selected by ``format_type``"""
+        # Save to JSON
+        if format_type in ["json", "both"]:
+            await self._save_transactions_json(transactions, timestamp)
+        
+        # Save to CSV
+        if format_type in ["csv", "both"]:
+            await self._save_transactions_csv(transactions, timestamp)
+    
     async def _save_tokens_json(self, tokens: List[TokenInfo], timestamp: str):
         """Save tokens to JSON file"""
-        filename = self.output_dir / "tokens" / f"tokens_{timestamp}.json"
-        data = [token.model_dump(mode='json') for token in tokens]
-        
-        async with aiofiles.open(filename, "w") as f:
-            await f.write(json.dumps(data, indent=2, default=str))
+        filename = self._tokens_dir / f"tokens_{timestamp}.json"
+        await self._write_json(filename, tokens, TokenInfo)
+    
+    async def _write_json(self, filename: Path, data: List, model_class):
+        """Write a list of Pydantic models to an indented JSON file"""
+        payload = _LIST_ADAPTERS[model_class].dump_json(data, indent=2)
+        await self._write_bytes(filename, payload)
+    
+    async def _write_bytes(self, filename: Path, payload: bytes):
+        """Write a finished payload in one call on the default executor"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, filename.write_bytes, payload)
     
     async def _save_tokens_csv(self, tokens: List[TokenInfo], timestamp: str):
         """Save tokens to CSV file"""
-        filename = self.output_dir / "tokens" / f"tokens_{timestamp}.csv"
+        filename = self._tokens_dir / f"tokens_{timestamp}.csv"
         await self._write_csv(filename, tokens, TokenInfo)
     
     async def _save_transactions_json(self, transactions: List[TransactionData], timestamp: str):
         """Save transactions to JSON file"""
-        filename = self.output_dir / "transactions" / f"transactions_{timestamp}.json"
-        data = [tx.model_dump(mode='json') for tx in transactions]
-        
-        async with aiofiles.open(filename, "w") as f:
-            await f.write(json.dumps(data, indent=2, default=str))
+        filename = self._transactions_dir / f"transactions_{timestamp}.json"
+        await self._write_json(filename, transactions, TransactionData)
     
     async def _save_transactions_csv(self, transactions: List[TransactionData], timestamp: str):
         """Save transactions to CSV file"""
-        filename = self.output_dir / "transactions" / f"transactions_{timestamp}.csv"
+        filename = self._transactions_dir / f"transactions_{timestamp}.csv"
         await self._write_csv(filename, transactions, TransactionData)
     
     async def _save_tokens_db(self, tokens: List[TokenInfo]):
-        """Save tokens to SQLite database"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            for token in tokens:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO tokens 
-                    (name, symbol, price, market_cap, volume_24h, created_timestamp,
-                     mint_address, description, image_uri, twitter, telegram, website, scraped_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    token.name, token.symbol, token.price, token.market_cap,
-                    token.volume_24h, token.created_timestamp, token.mint_address,
-                    token.description, token.image_uri, token.twitter,
-                    token.telegram, token.website, token.scraped_at
-                ))
-            
-            conn.commit()
+        """Save tokens to SQLite database in one executemany transaction"""
+        rows = self._pending_token_rows(tokens)
+        await self._write_rows((_INSERT_TOKEN_SQL, rows))
+        self._remember_token_rows(rows)
     
     async def _save_transactions_db(self, transactions: List[TransactionData]):
-        """Save transactions to SQLite database"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            for tx in transactions:
-                cursor.execute("""
-                    INSERT OR IGNORE INTO transactions 
-                    (signature, token_mint, action, amount, price, user_address, timestamp, scraped_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    tx.signature, tx.token_mint, tx.action, tx.amount,
-                    tx.price, tx.user, tx.timestamp, tx.scraped_at
-                ))
-            
-            conn.commit()
+        """Save transactions to SQLite database in one executemany transaction"""
+        rows = list(map(_transaction_row, transactions))
+        await self._write_rows((_INSERT_TRANSACTION_SQL, rows))
+    
+    def _pending_token_rows(self, tokens: List[TokenInfo]) -> List[tuple]:
+        """Rows for the tokens that actually need writing
+        
+        Only the last token per mint in the batch is kept, and tokens whose
+        row matches what this instance last wrote are skipped entirely.
+        """
+        latest = {token.mint_address: token for token in tokens}
+        written = self._written_tokens
+        rows = []
+        for mint, token in latest.items():
+            row = _token_row(token)
+            if written.get(mint) != row:
+                rows.append(row)
+        return rows
+    
+    def _remember_token_rows(self, rows: List[tuple]):
+        """Record rows that reached the database in the written-token LRU"""
+        written = self._written_tokens
+        for row in rows:
+            mint = row[_TOKEN_MINT_INDEX]
+            written[mint] = row
+            written.move_to_end(mint)
+        while len(written) > self.WRITTEN_TOKENS_CACHE_SIZE:
+            written.popitem(last=False)
+    
+    async def _write_rows(self, *batches: tuple):
+        """Write ``(sql, rows)`` batches in one transaction on the SQLite thread"""
+        batches = tuple((sql, rows) for sql, rows in batches if rows)
+        if not batches:
+            return
+        await self._run_db(self._insert_rows_sync, batches)
+        # Cached summaries no longer reflect the table contents
+        self._summary_cache.clear()
+    
+    def _insert_rows_sync(self, batches: tuple):
+        """Run each batch's executemany inside a single transaction"""
+        with self._conn as conn:
+            for sql, rows in batches:
+                conn.executemany(sql, rows)
     
     async def _write_csv(self, filename: Path, data: List, model_class):
         """Generic CSV writer for Pydantic models"""
         if not data:
             return
         
-        # Get field names from the first item
-        fieldnames = list(data[0].model_dump().keys())
+        fieldnames = list(model_class.model_fields)
+        # JSON mode already renders datetimes as ISO strings
+        rows = _LIST_ADAPTERS[model_class].dump_python(data, mode='json')
         
-        with open(filename, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for item in data:
-                row_data = item.model_dump()
-                # Convert datetime objects to strings
-                for key, value in row_data.items():
-                    if isinstance(value, datetime):
-                        row_data[key] = value.isoformat()
-                writer.writerow(row_data)
+        # Format in memory, then write the file in a single executor call
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fieldnames)
+        writer.writerows(map(itemgetter(*fieldnames), rows))
+        
+        await self._write_bytes(filename, buffer.getvalue().encode("utf-8"))
     
     async def get_daily_summary(self, date: datetime = None) -> Dict[str, Any]:
-        """Get daily summary statistics"""
+        """Get daily summary statistics
+        
+        Results are cached briefly per date, and concurrent callers for the same
+        date share a single query.
+        """
         if date is None:
             date = datetime.now().date()
+        elif isinstance(date, datetime):
+            date = date.date()
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Token statistics
-            cursor.execute("""
-                SELECT COUNT(*) as token_count,
-                       AVG(market_cap) as avg_market_cap,
-                       SUM(volume_24h) as total_volume
-                FROM tokens 
-                WHERE DATE(scraped_at) = ?
-            """, (date,))
-            
-            token_stats = cursor.fetchone()
-            
-            # Transaction statistics
-            cursor.execute("""
-                SELECT COUNT(*) as tx_count,
-                       COUNT(DISTINCT token_mint) as unique_tokens,
-                       SUM(CASE WHEN action = 'buy' THEN amount ELSE 0 END) as total_buys,
-                       SUM(CASE WHEN action = 'sell' THEN amount ELSE 0 END) as total_sells
-                FROM transactions 
-                WHERE DATE(scraped_at) = ?
-            """, (date,))
-            
-            tx_stats = cursor.fetchone()
-            
-            return {
-                "date": date.isoformat(),
-                "tokens": {
-                    "count": token_stats[0] or 0,
-                    "avg_market_cap": token_stats[1] or 0,
-                    "total_volume": token_stats[2] or 0
-                },
-                "transactions": {
-                    "count": tx_stats[0] or 0,
-                    "unique_tokens": tx_stats[1] or 0,
-                    "total_buys": tx_stats[2] or 0,
-                    "total_sells": tx_stats[3] or 0
-                }
+        key = date.isoformat()
+        cached = self._summary_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            token_stats, tx_stats = cached[1]
+        else:
+            query = self._summary_inflight.get(key)
+            if query is None:
+                query = asyncio.ensure_future(self._load_daily_summary(key, date))
+                self._summary_inflight[key] = query
+            # Shielded so one cancelled caller does not cancel the shared query
+            token_stats, tx_stats = await asyncio.shield(query)
+        
+        return {
+            "date": date.isoformat(),
+            "tokens": {
+                "count": token_stats[0] or 0,
+                "avg_market_cap": token_stats[1] or 0,
+                "total_volume": token_stats[2] or 0
+            },
+            "transactions": {
+                "count": tx_stats[0] or 0,
+                "unique_tokens": tx_stats[1] or 0,
+                "total_buys": tx_stats[2] or 0,
+                "total_sells": tx_stats[3] or 0
             }
+        }
+    
+    async def _load_daily_summary(self, key: str, date) -> tuple:
+        """Run the summary queries for one date and cache the result"""
+        try:
+            stats = await self._run_db(self._daily_summary_sync, date)
+        finally:
+            self._summary_inflight.pop(key, None)
+        
+        today = key.startswith(datetime.now().date().isoformat())
+        ttl = self.SUMMARY_TTL_TODAY if today else self.SUMMARY_TTL_PAST
+        self._summary_cache[key] = (time.monotonic() + ttl, stats)
+        return stats
+    
+    def _daily_summary_sync(self, date) -> tuple:
+        """Run the daily summary aggregates"""
+        # A half-open range over scraped_at can use its index; DATE(scraped_at)
+        # cannot. Stored timestamps sort as text, so day strings bound them
+        day = {"start": date.isoformat(), "end": (date + timedelta(days=1)).isoformat()}
+        row = self._conn.execute(_DAILY_SUMMARY_SQL, day).fetchone()
+        return row[:3], row[3:]
     
     async def export_data(self, start_date: datetime = None, end_date: datetime = None, format_type: str = "json"):
-        """Export historical data within date range"""
+        """Export historical data within date range
+        
+        Writes one JSON document with a list of row objects per table.
+        """
         if start_date is None:
             start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         
         if end_date is None:
             end_date = datetime.now()
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Export tokens
-            cursor.execute("""
-                SELECT * FROM tokens 
-                WHERE scraped_at BETWEEN ? AND ?
-                ORDER BY scraped_at DESC
-            """, (start_date, end_date))
-            
-            tokens_data = cursor.fetchall()
-            
-            # Export transactions
-            cursor.execute("""
-                SELECT * FROM transactions 
-                WHERE scraped_at BETWEEN ? AND ?
-                ORDER BY scraped_at DESC
-            """, (start_date, end_date))
-            
-            transactions_data = cursor.fetchall()
-        
         # Save exported data
         export_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         if format_type == "json":
+            tables = await self._run_db(self._export_rows_sync, start_date, end_date)
             export_data = {
                 "export_timestamp": export_timestamp,
                 "date_range": {
                     "start": start_date.isoformat(),
                     "end": end_date.isoformat()
                 },
-                "tokens": tokens_data,
-                "transactions": transactions_data
+                **tables
             }
             
             filename = self.output_dir / f"export_{export_timestamp}.json"
-            async with aiofiles.open(filename, "w") as f:
-                await f.write(json.dumps(export_data, indent=2, default=str))
+            await self._write_bytes(
+                filename, orjson.dumps(export_data, default=str, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            raise ValueError(f"Unsupported export format: {format_type}")
         
         self.logger.info(f"Exported data to {filename}")
-        return str(filename)
\ No newline at end of file
+        return str(filename)
+    
+    def _export_rows_sync(self, start_date: datetime, end_date: datetime) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch the token and transaction rows inside an export window"""
+        return {
+            table: [
+                dict(zip(columns, row))
+                for row in self._conn.execute(query, (start_date, end_date))
+            ]
+            for table, columns, query in _EXPORT_QUERIES
+        }
@@ -0,0 +1,28 @@
+"""
+Event loop selection for the pump.fun scraper entry points
+"""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # Not installed, or unsupported platform (Windows)
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion, on uvloop when it is available
+    
+    Args:
+        main: Entry point coroutine
+        
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
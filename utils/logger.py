@@ -2,50 +2,154 @@
 Logging utilities for the pump.fun scraper
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
-from datetime import datetime
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from itertools import islice
+from typing import Dict, List, Optional
+
+
+# Request log formats, filled in lazily by the logging framework
+_SUCCESS_FMT = "Successful request to: %s"
+_FAIL_FMT = "Failed request to: %s - Error: %s"
+
+# Background listeners owning each configured logger's real handlers
+_LISTENERS: Dict[str, logging.handlers.QueueListener] = {}
+
+
+def _stop_listener(name: str):
+    """Flush and stop the listener for ``name`` and close its handlers"""
+    listener = _LISTENERS.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+@atexit.register
+def _stop_all_listeners():
+    for name in list(_LISTENERS):
+        _stop_listener(name)
+
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the strftime part of asctime within the same second
+    
+    With ``DEFAULT_FORMAT`` it also builds plain records with a single
+    f-string; records carrying exception or stack info take the normal path.
+    """
+    
+    _cached_time = (None, "")
+    
+    def __init__(self, fmt=None, datefmt=None, style='%', *args, **kwargs):
+        super().__init__(fmt, datefmt, style, *args, **kwargs)
+        self._fast = style == '%' and fmt == DEFAULT_FORMAT
+    
+    def format(self, record):
+        if not self._fast or record.exc_info or record.exc_text or record.stack_info:
+            return super().format(record)
+        
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        return f"{record.asctime} - {record.name} - {record.levelname} - {record.message}"
+    
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, text = self._cached_time
+        if second != cached_second:
+            text = time.strftime(
+                datefmt or self.default_time_format, self.converter(record.created)
+            )
+            self._cached_time = (second, text)
+        
+        if datefmt or not self.default_msec_format:
+            return text
+        return self.default_msec_format % (text, record.msecs)
 
 
 def setup_logger(
     name: str,
     log_level: str = "INFO",
     log_file: Optional[str] = None,
-    format_string: Optional[str] = None
+    format_string: Optional[str] = None,
+    max_bytes: int = 0,
+    backup_count: int = 5,
+    console_level: Optional[str] = None,
+    file_level: Optional[str] = None
 ) -> logging.Logger:
     """
     Set up a logger with console and optional file output
+    
+    The logger itself only gets a QueueHandler; the console and file handlers
+    run on a QueueListener thread so callers never block on terminal or disk
+    I/O. With ``max_bytes`` set the log file is a RotatingFileHandler, so
+    rotation happens on that thread too.
+    
+    ``console_level`` defaults to INFO (or ``log_level`` if higher) and
+    ``file_level`` to ``log_level``. The logger's own level is the lowest of
+    the handler levels, so records no handler wants are dropped before they
+    are queued.
     """
     
+    level = getattr(logging, log_level.upper())
+    if console_level:
+        console_levelno = getattr(logging, console_level.upper())
+    else:
+        console_levelno = max(logging.INFO, level)
+    file_levelno = getattr(logging, file_level.upper()) if file_level else level
+    
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, log_level.upper()))
+    logger.setLevel(min(console_levelno, file_levelno) if log_file else console_levelno)
     
-    # Clear any existing handlers to avoid duplicate logs
+    # Clear any existing handlers to avoid duplicate logs, draining the
+    # previous listener first so nothing it still holds is lost
+    _stop_listener(name)
     logger.handlers.clear()
     
     # Default format
     if format_string is None:
-        format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        format_string = DEFAULT_FORMAT
     
-    formatter = logging.Formatter(format_string)
+    formatter = CachedTimeFormatter(format_string)
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
+    console_handler.setLevel(console_levelno)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler (if specified)
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(exist_ok=True)
         
-        file_handler = logging.FileHandler(log_path)
-        file_handler.setLevel(getattr(logging, log_level.upper()))
+        if max_bytes:
+            file_handler = RotatingFileHandler(str(log_path), max_bytes, backup_count)
+        else:
+            file_handler = logging.FileHandler(log_path)
+        file_handler.setLevel(file_levelno)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    _LISTENERS[name] = listener
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     return logger
 
@@ -53,23 +157,38 @@ def setup_logger(
 class ScrapeLogger:
     """
     Enhanced logger for scraping operations with statistics tracking
+    
+    Scrape counts are batched: at most one line per ``flush_interval``
+    seconds reports everything scraped since the previous line. Pass
+    ``flush_interval=0`` to log every call.
     """
     
-    def __init__(self, logger: logging.Logger):
+    def __init__(
+        self,
+        logger: logging.Logger,
+        max_errors: int = 100,
+        flush_interval: float = 1.0
+    ):
         self.logger = logger
+        self.flush_interval = flush_interval
+        self._pending_tokens = 0
+        self._pending_tx = 0
+        self._last_flush = time.monotonic()
         self.stats = {
-            "start_time": None,
+            "start_time": None,  # time.monotonic() at session start
+            "start_wallclock": None,
             "requests_made": 0,
             "successful_requests": 0,
             "failed_requests": 0,
             "tokens_scraped": 0,
             "transactions_scraped": 0,
-            "errors": []
+            "errors": deque(maxlen=max_errors)  # Most recent errors only
         }
     
     def start_session(self):
         """Start a new scraping session"""
-        self.stats["start_time"] = datetime.now()
+        self.stats["start_time"] = time.monotonic()
+        self.stats["start_wallclock"] = datetime.now().isoformat()
         self.logger.info("Starting new scraping session")
     
     def log_request(self, url: str, success: bool = True, error: str = None):
@@ -78,31 +197,60 @@ class ScrapeLogger:
         
         if success:
             self.stats["successful_requests"] += 1
-            self.logger.debug(f"Successful request to: {url}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(_SUCCESS_FMT, url)
         else:
             self.stats["failed_requests"] += 1
             if error:
-                self.stats["errors"].append(f"{datetime.now().isoformat()}: {error}")
-            self.logger.warning(f"Failed request to: {url} - Error: {error}")
+                self.stats["errors"].append((time.time(), error))
+            self.logger.warning(_FAIL_FMT, url, error)
     
     def log_tokens_scraped(self, count: int):
         """Log number of tokens scraped"""
         self.stats["tokens_scraped"] += count
-        self.logger.info(f"Scraped {count} tokens (Total: {self.stats['tokens_scraped']})")
+        self._pending_tokens += count
+        self._maybe_flush()
     
     def log_transactions_scraped(self, count: int):
         """Log number of transactions scraped"""
         self.stats["transactions_scraped"] += count
-        self.logger.info(f"Scraped {count} transactions (Total: {self.stats['transactions_scraped']})")
+        self._pending_tx += count
+        self._maybe_flush()
+    
+    def _maybe_flush(self):
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+    
+    def flush(self):
+        """Log the scrape counts accumulated since the last flush"""
+        now = time.monotonic()
+        elapsed = now - self._last_flush
+        
+        if self._pending_tokens:
+            self.logger.info(
+                "Scraped %d tokens in %.1fs (Total: %d)",
+                self._pending_tokens, elapsed, self.stats["tokens_scraped"]
+            )
+        if self._pending_tx:
+            self.logger.info(
+                "Scraped %d transactions in %.1fs (Total: %d)",
+                self._pending_tx, elapsed, self.stats["transactions_scraped"]
+            )
+        
+        self._pending_tokens = 0
+        self._pending_tx = 0
+        self._last_flush = now
     
     def log_rate_limit_hit(self, wait_time: float):
         """Log when rate limit is hit"""
-        self.logger.warning(f"Rate limit hit, waiting {wait_time:.2f} seconds")
+        self.logger.warning("Rate limit hit, waiting %.2f seconds", wait_time)
     
     def log_session_summary(self):
         """Log session summary statistics"""
+        self.flush()
+        
         if self.stats["start_time"]:
-            duration = datetime.now() - self.stats["start_time"]
+            duration = timedelta(seconds=time.monotonic() - self.stats["start_time"])
             success_rate = (
                 self.stats["successful_requests"] / self.stats["requests_made"] * 100
                 if self.stats["requests_made"] > 0 else 0
@@ -121,31 +269,77 @@ Errors: {len(self.stats['errors'])}
             
             if self.stats["errors"]:
                 self.logger.error("Recent errors:")
-                for error in self.stats["errors"][-5:]:  # Show last 5 errors
-                    self.logger.error(f"  {error}")
+                for error in self.get_recent_errors(5):
+                    self.logger.error("  %s", error)
     
     def get_stats(self) -> dict:
         """Get current session statistics"""
-        stats = self.stats.copy()
-        if stats["start_time"]:
-            stats["duration"] = datetime.now() - stats["start_time"]
-        return stats
+        stats = self.stats
+        return {
+            "start_time": stats["start_wallclock"],
+            "requests_made": stats["requests_made"],
+            "successful_requests": stats["successful_requests"],
+            "failed_requests": stats["failed_requests"],
+            "tokens_scraped": stats["tokens_scraped"],
+            "transactions_scraped": stats["transactions_scraped"],
+            "errors_count": len(stats["errors"]),
+            "duration": (
+                timedelta(seconds=time.monotonic() - stats["start_time"])
+                if stats["start_time"] else None
+            )
+        }
+    
+    def get_recent_errors(self, n: int = 5) -> List[str]:
+        """Get the ``n`` most recent errors, oldest first"""
+        errors = self.stats["errors"]
+        return [
+            f"{datetime.fromtimestamp(stamp).isoformat()}: {error}"
+            for stamp, error in islice(errors, max(0, len(errors) - n), None)
+        ]
 
 
 class RotatingFileHandler(logging.Handler):
     """
     Custom rotating file handler for log files
+    
+    Records are written to a 64 KiB buffered binary file. The buffer is
+    flushed once ``flush_bytes`` have accumulated or a WARNING (or worse)
+    record arrives; otherwise a timer flushes it ``flush_interval`` seconds
+    after the first unflushed record, even if no further records follow.
+    
+    Writes and rotation both happen inside emit, so run it behind a
+    QueueListener (see ``setup_logger``) to keep them off caller threads.
     """
     
-    def __init__(self, base_filename: str, max_bytes: int = 10*1024*1024, backup_count: int = 5):
+    BUFFER_SIZE = 64 * 1024
+    
+    def __init__(
+        self,
+        base_filename: str,
+        max_bytes: int = 10*1024*1024,
+        backup_count: int = 5,
+        flush_bytes: int = BUFFER_SIZE,
+        flush_interval: float = 1.0,
+    ):
         super().__init__()
         self.base_filename = base_filename
         self.max_bytes = max_bytes
         self.backup_count = backup_count
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
         self.current_size = 0
+        self._unflushed = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        
+        # Current file followed by its .1 ... .N backups
+        base_path = Path(base_filename)
+        self._rot_paths = [base_path] + [
+            base_path.with_suffix(f'.{i}{base_path.suffix}')
+            for i in range(1, max(backup_count, 1) + 1)
+        ]
         
         # Create log directory if it doesn't exist
-        Path(base_filename).parent.mkdir(exist_ok=True)
+        base_path.parent.mkdir(exist_ok=True)
         
         # Initialize current log file
         self.current_file = self._open_log_file()
@@ -157,31 +351,23 @@ class RotatingFileHandler(logging.Handler):
             self.current_size = log_path.stat().st_size
         else:
             self.current_size = 0
+        self._unflushed = 0
         
-        return open(self.base_filename, 'a', encoding='utf-8')
+        return open(self.base_filename, 'ab', buffering=self.BUFFER_SIZE)
     
     def _rotate_logs(self):
         """Rotate log files when size limit is reached"""
         self.current_file.close()
         
-        base_path = Path(self.base_filename)
-        
-        # Rotate existing backup files
-        for i in range(self.backup_count - 1, 0, -1):
-            old_file = base_path.with_suffix(f'.{i}{base_path.suffix}')
-            new_file = base_path.with_suffix(f'.{i+1}{base_path.suffix}')
-            
-            if old_file.exists():
-                if new_file.exists():
-                    new_file.unlink()
-                old_file.rename(new_file)
+        # Shift existing backups up one slot; os.replace overwrites the target
+        paths = self._rot_paths
+        for i in range(len(paths) - 2, 0, -1):
+            if paths[i].exists():
+                os.replace(paths[i], paths[i + 1])
         
         # Move current file to .1
-        if base_path.exists():
-            backup_file = base_path.with_suffix(f'.1{base_path.suffix}')
-            if backup_file.exists():
-                backup_file.unlink()
-            base_path.rename(backup_file)
+        if paths[0].exists():
+            os.replace(paths[0], paths[1])
         
         # Open new current file
         self.current_file = self._open_log_file()
@@ -189,20 +375,45 @@ class RotatingFileHandler(logging.Handler):
     def emit(self, record):
         """Emit a log record"""
         try:
-            msg = self.format(record) + '\n'
-            self.current_file.write(msg)
-            self.current_file.flush()
+            data = (self.format(record) + '\n').encode('utf-8')
+            self.current_file.write(data)
             
-            self.current_size += len(msg.encode('utf-8'))
+            self.current_size += len(data)
+            self._unflushed += len(data)
             
             if self.current_size >= self.max_bytes:
                 self._rotate_logs()
+            elif self._unflushed >= self.flush_bytes or record.levelno >= logging.WARNING:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
         
         except Exception:
             self.handleError(record)
     
+    def _timed_flush(self):
+        """Flush records left in the buffer after a quiet period"""
+        self.acquire()
+        try:
+            self._flush_timer = None
+            self.flush()
+        finally:
+            self.release()
+    
+    def flush(self):
+        """Write buffered records to disk"""
+        if self.current_file and not self.current_file.closed:
+            self.current_file.flush()
+        self._unflushed = 0
+    
     def close(self):
         """Close the handler"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
         if self.current_file:
+            # Closing a buffered file flushes it first
             self.current_file.close()
         super().close()
\ No newline at end of file
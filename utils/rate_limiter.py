@@ -4,13 +4,16 @@ Rate limiting utilities for the pump.fun scraper
 
 import asyncio
 import time
-from collections import deque
 from typing import Optional
 
 
 class RateLimiter:
     """
     Async rate limiter to prevent API abuse and being blocked
+    
+    Uses two token buckets, one per minute and one per hour. Each holds only
+    its token count and last refill time, so memory stays constant whatever
+    the limits are. The minute bucket is capped at ``burst_limit``.
     """
     
     def __init__(
@@ -21,94 +24,86 @@ class RateLimiter:
     ):
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
-        self.burst_limit = burst_limit or min(10, requests_per_minute // 2)
-        
-        # Track request timestamps
-        self.minute_requests = deque()
-        self.hour_requests = deque()
+        self.burst_limit = burst_limit or max(1, min(10, requests_per_minute // 2))
         
-        # Lock for thread safety
-        self._lock = asyncio.Lock()
+        # Bucket state: available tokens and when they were last refilled
+        now = time.monotonic()
+        self._min_capacity = float(min(self.burst_limit, requests_per_minute))
+        self._min_tokens = self._min_capacity
+        self._min_last = now
+        self._hour_tokens = float(requests_per_hour)
+        self._hour_last = now
     
     async def wait_if_needed(self):
         """
         Wait if necessary to respect rate limits
         """
-        async with self._lock:
-            current_time = time.time()
-            
-            # Clean old requests from tracking
-            self._clean_old_requests(current_time)
-            
-            # Check minute limit
-            minute_wait = self._calculate_wait_time(
-                self.minute_requests,
-                current_time,
-                60,  # 60 seconds
-                self.requests_per_minute
-            )
-            
-            # Check hour limit
-            hour_wait = self._calculate_wait_time(
-                self.hour_requests,
-                current_time,
-                3600,  # 3600 seconds
-                self.requests_per_hour
-            )
-            
-            # Wait for the longer of the two
-            wait_time = max(minute_wait, hour_wait)
-            
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
-                current_time = time.time()
-            
-            # Record this request
-            self.minute_requests.append(current_time)
-            self.hour_requests.append(current_time)
-    
-    def _clean_old_requests(self, current_time: float):
-        """Remove old request timestamps from tracking"""
-        # Clean minute requests (older than 60 seconds)
-        while self.minute_requests and current_time - self.minute_requests[0] > 60:
-            self.minute_requests.popleft()
+        # Any backoff delay shares a sleep with the wait for a token
+        delay = self._backoff_delay()
+        while True:
+            wait_time = self._try_consume()
+            if not wait_time:
+                break
+            await asyncio.sleep(max(wait_time, delay))
+            delay = 0.0
         
-        # Clean hour requests (older than 3600 seconds)
-        while self.hour_requests and current_time - self.hour_requests[0] > 3600:
-            self.hour_requests.popleft()
+        if delay > 0:
+            await asyncio.sleep(delay)
     
-    def _calculate_wait_time(
-        self,
-        request_queue: deque,
-        current_time: float,
-        window_seconds: int,
-        max_requests: int
-    ) -> float:
-        """Calculate how long to wait based on request history"""
-        if len(request_queue) < max_requests:
-            return 0
+    def _backoff_delay(self) -> float:
+        """Extra delay to add to the next request"""
+        return 0.0
+    
+    def _try_consume(self) -> float:
+        """Take a token from both buckets, or return how long to wait
         
-        # If we're at the limit, wait until the oldest request expires
-        oldest_request = request_queue[0]
-        time_since_oldest = current_time - oldest_request
+        There is no await in here, so under asyncio the update cannot be
+        interleaved with another task and needs no lock.
+        """
+        self._refill(time.monotonic())
+        
+        if self._min_tokens >= 1 and self._hour_tokens >= 1:
+            self._min_tokens -= 1
+            self._hour_tokens -= 1
+            return 0.0
         
-        if time_since_oldest < window_seconds:
-            return window_seconds - time_since_oldest + 0.1  # Small buffer
+        # Wait until both buckets hold a whole token again
+        return max(
+            (1 - self._min_tokens) * 60 / self.requests_per_minute,
+            (1 - self._hour_tokens) * 3600 / self.requests_per_hour,
+        )
+    
+    def _refill(self, now: float):
+        """Top up both buckets for the time elapsed since the last refill"""
+        self._min_tokens = min(
+            self._min_capacity,
+            self._min_tokens + (now - self._min_last) * self.requests_per_minute / 60
+        )
+        self._min_last = now
         
-        return 0
+        self._hour_tokens = min(
+            self.requests_per_hour,
+            self._hour_tokens + (now - self._hour_last) * self.requests_per_hour / 3600
+        )
+        self._hour_last = now
     
     def get_stats(self) -> dict:
-        """Get current rate limiting statistics"""
-        current_time = time.time()
-        self._clean_old_requests(current_time)
+        """Get current rate limiting statistics
+        
+        Request counts are derived from the tokens missing from each bucket,
+        so they approximate the number of recent requests.
+        """
+        self._refill(time.monotonic())
+        minute_count = round(self._min_capacity - self._min_tokens)
+        hour_count = round(self.requests_per_hour - self._hour_tokens)
         
         return {
-            "requests_last_minute": len(self.minute_requests),
-            "requests_last_hour": len(self.hour_requests),
+            "requests_last_minute": minute_count,
+            "requests_last_hour": hour_count,
             "minute_limit": self.requests_per_minute,
             "hour_limit": self.requests_per_hour,
-            "minute_utilization": len(self.minute_requests) / self.requests_per_minute * 100,
-            "hour_utilization": len(self.hour_requests) / self.requests_per_hour * 100
+            "minute_utilization": minute_count / self.requests_per_minute * 100,
+            "hour_utilization": hour_count / self.requests_per_hour * 100
         }
 
 
@@ -142,10 +137,6 @@ class AdaptiveRateLimiter(RateLimiter):
                     self.current_delay * 0.9
                 )
     
-    async def wait_if_needed(self):
-        """Wait with adaptive delay"""
-        await super().wait_if_needed()
-        
-        # Additional adaptive delay
-        if self.current_delay > self.base_delay:
-            await asyncio.sleep(self.current_delay - self.base_delay)
\ No newline at end of file
+    def _backoff_delay(self) -> float:
+        """Adaptive delay on top of the base rate limits"""
+        return self.current_delay - self.base_delay
\ No newline at end of file